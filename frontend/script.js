@@ -2,9 +2,20 @@ document.addEventListener('DOMContentLoaded', () => {
     app.init();
 });
 
+// Elements touched on every dashboard tick or log chunk are static in index.html, so each is looked up once.
+const DOM = {};
+const byId = id => DOM[id] || (DOM[id] = document.getElementById(id));
+
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+// Model names, hub ids, process names and error text come from outside; escape them before they reach innerHTML.
+const escapeHtml = s => (s == null ? '' : String(s)).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+
+const STATUS_COLORS = { running: 'bg-green-600', starting: 'bg-blue-600', error: 'bg-red-600', completed: 'bg-yellow-600' };
+
 const app = {
     state: {
         refreshInterval: null,
+        dashboardWs: null,
         logWs: null,
         publicKey: null,
         browseLimit: 20,
@@ -64,7 +75,6 @@ const app = {
         },
 
         ansiToHtml(text) {
-            const escapeHtml = (s) => s.replace(/[&<>"']/g, (c) => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' })[c]);
             const escaped = escapeHtml(text);
             const ansiRegex = /\x1b\[(\d+(?:;\d+)*)m/g;
             const sgrMap = { 0:'ansi-reset', 1:'ansi-bold', 31:'ansi-red', 32:'ansi-green', 33:'ansi-yellow', 34:'ansi-blue' };
@@ -85,7 +95,7 @@ const app = {
 
         showLogModal(title) {
             document.getElementById('log-modal-title').textContent = title;
-            document.getElementById('log-pre').innerHTML = '';
+            byId('log-pre').innerHTML = '';
             document.getElementById('log-modal').classList.remove('hidden');
         },
         hideLogModal() {
@@ -93,8 +103,9 @@ const app = {
             if (app.state.logWs) { app.state.logWs.close(); app.state.logWs = null; }
         },
         appendLog(text) {
-            const pre = document.getElementById('log-pre');
-            pre.innerHTML += app.ui.ansiToHtml(text);
+            const pre = byId('log-pre');
+            // insertAdjacentHTML parses only the new chunk; innerHTML += re-serializes and re-parses the whole log each time.
+            pre.insertAdjacentHTML('beforeend', app.ui.ansiToHtml(text));
             pre.scrollTop = pre.scrollHeight;
         },
         copyLog() {
@@ -128,56 +139,104 @@ const app = {
             document.getElementById('save-admin-settings-btn').disabled = settings.is_password_env_managed;
         },
 
+        // Keyed reconciliation: a row is re-parsed only when its markup changed; unchanged rows keep their DOM nodes.
+        // The optional update(el, item) then patches fast-changing values in place without touching the markup.
+        syncRows(container, items, key, render, update) {
+            const rows = container._rows || (container._rows = new Map());
+            if (rows.size === 0) { container.replaceChildren(); container._html = null; }
+            const keys = new Set(items.map(key));
+            for (const [k, row] of rows) if (!keys.has(k)) { row.el.remove(); rows.delete(k); }
+            items.forEach((item, i) => {
+                const k = key(item), html = render(item);
+                let row = rows.get(k);
+                if (!row || row.html !== html) {
+                    const tpl = document.createElement('template');
+                    tpl.innerHTML = html.trim();
+                    const el = tpl.content.firstElementChild;
+                    if (row) row.el.replaceWith(el);
+                    row = { html, el }; rows.set(k, row);
+                }
+                if (container.children[i] !== row.el) container.insertBefore(row.el, container.children[i] || null);
+                if (update) update(row.el, item);
+            });
+        },
+
+        showEmpty(container, html) {
+            if (container._rows) container._rows.clear();
+            this.setHtml(container, html);
+        },
+
+        // Skips the re-parse when a panel's markup is unchanged since the last render.
+        setHtml(el, html) {
+            if (el._html === html) return;
+            el._html = html; el.innerHTML = html;
+        },
+
         renderModelList(models) {
-            const listEl = document.getElementById('model-list');
-            if (models.length === 0) {
-                listEl.innerHTML = `<div class="bg-gray-800 p-6 rounded-lg text-center text-gray-400">No models found.</div>`;
-                return;
-            }
-            listEl.innerHTML = models.map(m => {
-                const statusColors = { running: 'bg-green-600', starting: 'bg-blue-600', error: 'bg-red-600', completed: 'bg-yellow-600' };
-                const badgeColor = statusColors[m.status_text] || 'bg-gray-600';
-                const quant = (m.config && m.config.quantization) ? m.config.quantization : 'None';
-                return `
-                <div class="bg-gray-800 p-4 rounded-lg shadow-md flex flex-wrap gap-4 items-center justify-between">
-                    <div class="flex-grow min-w-0">
-                        <h4 class="font-bold text-lg text-white">${m.name}</h4>
-                        <p class="text-sm text-gray-400">${m.hf_model_id}</p>
-                        <div class="flex flex-wrap gap-2 mt-2 text-xs">
-                            <span class="bg-gray-700 px-2 py-1 rounded text-gray-300">Size: ${m.size_gb.toFixed(1)} GB</span>
-                            <span class="bg-gray-700 px-2 py-1 rounded text-gray-300">Quant: ${quant}</span>
-                            <span class="px-2 py-1 rounded text-white ${badgeColor}">${m.status_text}</span>
-                            ${m.port ? `<span class="bg-gray-700 px-2 py-1 rounded text-gray-300">Port: ${m.port}</span>` : ''}
-                        </div>
-                        ${m.error_message ? `<p class="text-red-400 text-xs mt-1">${m.error_message}</p>` : ''}
-                    </div>
-                    <div class="flex gap-2">
-                        ${m.status_text === 'error' ? `<button onclick="app.clearError(${m.id})" class="bg-gray-600 hover:bg-gray-500 text-white px-3 py-1 rounded text-sm">Clear</button>` : ''}
-                        ${m.status_text !== 'starting' ? `<button onclick="app.openEditModal(${m.id})" class="bg-gray-700 hover:bg-gray-600 text-white px-3 py-1 rounded text-sm">Edit</button>` : ''}
-                        <button onclick="app.showRuntimeLogs(${m.id})" class="bg-blue-600 hover:bg-blue-500 text-white px-3 py-1 rounded text-sm">Logs</button>
-                        ${m.status_text === 'running' 
-                            ? `<button onclick="app.stopModel(${m.id})" class="bg-yellow-600 hover:bg-yellow-500 text-white px-3 py-1 rounded text-sm">Stop</button>` 
-                            : `<button onclick="app.startModel(${m.id})" class="bg-green-600 hover:bg-green-500 text-white px-3 py-1 rounded text-sm" ${m.download_status !== 'completed' ? 'disabled' : ''}>Start</button>`}
-                        <button onclick="app.deleteModel(${m.id})" class="bg-red-600 hover:bg-red-500 text-white px-3 py-1 rounded text-sm">Delete</button>
+            const listEl = byId('model-list');
+            if (models.length === 0) return this.showEmpty(listEl, `<div class="bg-gray-800 p-6 rounded-lg text-center text-gray-400">No models found.</div>`);
+            this.syncRows(listEl, models, m => m.id, m => this.modelRow(m));
+        },
+
+        modelRow(m) {
+            const badgeColor = STATUS_COLORS[m.status_text] || 'bg-gray-600';
+            const quant = (m.config && m.config.quantization) ? m.config.quantization : 'None';
+            return `
+            <div class="bg-gray-800 p-4 rounded-lg shadow-md flex flex-wrap gap-4 items-center justify-between">
+                <div class="flex-grow min-w-0">
+                    <h4 class="font-bold text-lg text-white">${escapeHtml(m.name)}</h4>
+                    <p class="text-sm text-gray-400">${escapeHtml(m.hf_model_id)}</p>
+                    <div class="flex flex-wrap gap-2 mt-2 text-xs">
+                        <span class="bg-gray-700 px-2 py-1 rounded text-gray-300">Size: ${m.size_gb.toFixed(1)} GB</span>
+                        <span class="bg-gray-700 px-2 py-1 rounded text-gray-300">Quant: ${escapeHtml(quant)}</span>
+                        <span class="px-2 py-1 rounded text-white ${badgeColor}">${escapeHtml(m.status_text)}</span>
+                        ${m.port ? `<span class="bg-gray-700 px-2 py-1 rounded text-gray-300">Port: ${m.port}</span>` : ''}
                     </div>
-                </div>`;
-            }).join('');
+                    ${m.error_message ? `<p class="text-red-400 text-xs mt-1">${escapeHtml(m.error_message)}</p>` : ''}
+                </div>
+                <div class="flex gap-2">
+                    ${m.status_text === 'error' ? `<button onclick="app.clearError(${m.id})" class="bg-gray-600 hover:bg-gray-500 text-white px-3 py-1 rounded text-sm">Clear</button>` : ''}
+                    ${m.status_text !== 'starting' ? `<button onclick="app.openEditModal(${m.id})" class="bg-gray-700 hover:bg-gray-600 text-white px-3 py-1 rounded text-sm">Edit</button>` : ''}
+                    <button onclick="app.showRuntimeLogs(${m.id})" class="bg-blue-600 hover:bg-blue-500 text-white px-3 py-1 rounded text-sm">Logs</button>
+                    ${m.status_text === 'running' 
+                        ? `<button onclick="app.stopModel(${m.id})" class="bg-yellow-600 hover:bg-yellow-500 text-white px-3 py-1 rounded text-sm">Stop</button>` 
+                        : `<button onclick="app.startModel(${m.id})" class="bg-green-600 hover:bg-green-500 text-white px-3 py-1 rounded text-sm" ${m.download_status !== 'completed' ? 'disabled' : ''}>Start</button>`}
+                    <button onclick="app.deleteModel(${m.id})" class="bg-red-600 hover:bg-red-500 text-white px-3 py-1 rounded text-sm">Delete</button>
+                </div>
+            </div>`;
         },
 
         renderGpuList(gpus) {
-            const list = document.getElementById('gpu-list');
-            if (!gpus || gpus.length === 0) { list.innerHTML = '<div class="text-gray-400 p-4 text-center bg-gray-800 rounded">No GPUs</div>'; return; }
-            list.innerHTML = gpus.map(g => `
+            const list = byId('gpu-list');
+            if (!gpus || gpus.length === 0) return this.showEmpty(list, '<div class="text-gray-400 p-4 text-center bg-gray-800 rounded">No GPUs</div>');
+            this.syncRows(list, gpus, g => g.id, g => this.gpuCard(g), (el, g) => this.updateGpuCard(el, g));
+        },
+
+        // Temperature, load and memory (per GPU and per process) change every tick; patching them keeps gpuCard's markup,
+        // and so the card, stable until the set of processes changes.
+        updateGpuCard(el, g) {
+            const f = el._fields || (el._fields = Object.fromEntries(Array.from(el.querySelectorAll('[data-f]'), n => [n.dataset.f, n])));
+            const setText = (n, t) => { if (n.textContent !== t) n.textContent = t; };
+            // A transform is composited only; animating width would re-layout the card on every update.
+            f.bar.style.transform = `scaleX(${Math.min(1, g.memory_used_mb / (g.memory_total_mb || 1))})`;
+            setText(f.temp, `${g.temperature || 0}°C`);
+            setText(f.mem, `${(g.memory_used_mb/1024).toFixed(1)} / ${(g.memory_total_mb/1024).toFixed(1)} GB`);
+            setText(f.load, `${g.utilization_percent.toFixed(0)}% Load`);
+            for (const p of g.processes) setText(f[`pmem-${p.pid}`], `${p.gpu_memory_usage.toFixed(0)}MB`);
+        },
+
+        gpuCard(g) {
+            return `
                 <div class="bg-gray-800 p-4 rounded-lg shadow-lg border border-gray-700">
-                    <div class="flex justify-between mb-2"><span class="font-bold text-white">GPU ${g.id}: ${g.name}</span><span class="text-gray-400 text-sm">${g.temperature || 0}°C</span></div>
-                    <div class="h-2 bg-gray-700 rounded-full mb-1"><div class="h-full bg-indigo-500" style="width: ${(g.memory_used_mb/g.memory_total_mb)*100}%"></div></div>
-                    <div class="flex justify-between text-xs text-gray-400 mb-3"><span>${(g.memory_used_mb/1024).toFixed(1)} / ${(g.memory_total_mb/1024).toFixed(1)} GB</span><span>${g.utilization_percent.toFixed(0)}% Load</span></div>
+                    <div class="flex justify-between mb-2"><span class="font-bold text-white">GPU ${g.id}: ${escapeHtml(g.name)}</span><span class="text-gray-400 text-sm" data-f="temp"></span></div>
+                    <div class="h-2 bg-gray-700 rounded-full mb-1 overflow-hidden"><div class="h-full bg-indigo-500 gpu-bar" data-f="bar"></div></div>
+                    <div class="flex justify-between text-xs text-gray-400 mb-3"><span data-f="mem"></span><span data-f="load"></span></div>
                     <div class="space-y-1">
                         ${g.processes.length ? g.processes.map(p => `
                             <div class="flex justify-between items-center bg-gray-700/50 p-1.5 rounded text-xs">
-                                <span class="truncate max-w-[120px]" title="${p.process_name}">${p.process_name}</span>
+                                <span class="truncate max-w-[120px]" title="${escapeHtml(p.process_name)}">${escapeHtml(p.process_name)}</span>
                                 <div class="flex items-center gap-2">
-                                    <span class="text-gray-400">${p.gpu_memory_usage.toFixed(0)}MB</span>
+                                    <span class="text-gray-400" data-f="pmem-${p.pid}"></span>
                                     ${p.managed_model_id 
                                         ? `<button onclick="app.stopModel(${p.managed_model_id})" class="text-yellow-400 font-bold">Stop</button>` 
                                         : `<button onclick="app.killGpuProcess(${p.pid})" class="text-red-400 font-bold">Kill</button>`}
@@ -186,24 +245,24 @@ const app = {
                         `).join('') : '<div class="text-xs text-gray-500 italic">Idle</div>'}
                     </div>
                 </div>
-            `).join('');
+            `;
         },
 
         renderDashboardStats(stats) {
-            document.getElementById('stats-grid').innerHTML = `
+            this.setHtml(byId('stats-grid'), `
                 <div class="bg-gray-800 p-4 rounded shadow border border-gray-700"><div class="text-gray-400 text-sm">CPU</div><div class="text-2xl font-bold">${stats.system_cpu_percent.toFixed(1)}%</div></div>
                 <div class="bg-gray-800 p-4 rounded shadow border border-gray-700"><div class="text-gray-400 text-sm">RAM</div><div class="text-2xl font-bold">${stats.system_memory_percent.toFixed(1)}%</div></div>
                 <div class="bg-gray-800 p-4 rounded shadow border border-gray-700"><div class="text-gray-400 text-sm">Running</div><div class="text-2xl font-bold">${stats.running_models}</div></div>
                 <div class="bg-gray-800 p-4 rounded shadow border border-gray-700"><div class="text-gray-400 text-sm">Total</div><div class="text-2xl font-bold">${stats.total_models}</div></div>
-            `;
+            `);
         },
 
         renderSystemInfo(info) {
-            document.getElementById('system-info-card').innerHTML = `
+            this.setHtml(byId('system-info-card'), `
                 <h3 class="font-bold mb-2 text-lg">System</h3>
-                <div class="text-sm text-gray-300 space-y-1"><div>vLLM: <span class="text-indigo-400">${info.vllm_version}</span></div><div>Mode: <span class="text-indigo-400">${info.dev_mode?'Dev':'Prod'}</span></div></div>
+                <div class="text-sm text-gray-300 space-y-1"><div>vLLM: <span class="text-indigo-400">${escapeHtml(info.vllm_version)}</span></div><div>Mode: <span class="text-indigo-400">${info.dev_mode?'Dev':'Prod'}</span></div></div>
                 <button onclick="app.upgradeVLLM()" class="mt-3 w-full bg-indigo-600 hover:bg-indigo-500 text-white py-1.5 rounded text-sm font-bold">Upgrade vLLM</button>
-            `;
+            `);
         },
 
         renderHubResults(results, append) {
@@ -215,14 +274,14 @@ const app = {
             const html = results.map(m => `
                 <div class="bg-gray-800 p-3 rounded border border-gray-700 flex justify-between items-center mb-2 hover:bg-gray-750">
                     <div class="min-w-0 mr-2">
-                        <div class="font-bold text-indigo-300 text-sm truncate">${m.id}</div>
+                        <div class="font-bold text-indigo-300 text-sm truncate">${escapeHtml(m.id)}</div>
                         <div class="text-xs text-gray-500 mt-0.5 flex gap-3">
                             <span>⬇ ${app.formatNumber(m.downloads)}</span>
                             <span>♥ ${app.formatNumber(m.likes)}</span>
-                            <span>${m.pipeline_tag || 'text-gen'}</span>
+                            <span>${escapeHtml(m.pipeline_tag || 'text-gen')}</span>
                         </div>
                     </div>
-                    <button onclick="app.selectModelFromHub('${m.id}')" class="bg-green-700 hover:bg-green-600 text-white text-xs font-bold py-1.5 px-3 rounded">Pull</button>
+                    <button data-hub-id="${escapeHtml(m.id)}" onclick="app.selectModelFromHub(this.dataset.hubId)" class="bg-green-700 hover:bg-green-600 text-white text-xs font-bold py-1.5 px-3 rounded">Pull</button>
                 </div>
             `).join('');
 
@@ -241,18 +300,18 @@ const app = {
              const container = document.getElementById('browse-results');
              let html = '<div class="text-center text-gray-500 text-xs mb-4">Hand-picked state-of-the-art models</div>';
              for (const [category, models] of Object.entries(categories)) {
-                 html += `<h4 class="text-indigo-400 font-bold text-md mt-6 mb-3 uppercase tracking-wider border-b border-gray-700 pb-1">${category}</h4>`;
+                 html += `<h4 class="text-indigo-400 font-bold text-md mt-6 mb-3 uppercase tracking-wider border-b border-gray-700 pb-1">${escapeHtml(category)}</h4>`;
                  html += models.map(m => `
                     <div class="bg-gray-800 p-4 rounded border border-gray-700 flex justify-between items-center hover:bg-gray-750 transition mb-2">
                         <div class="flex-grow min-w-0 mr-4">
                             <div class="flex items-center gap-2">
-                                <h4 class="font-bold text-white text-lg">${m.name}</h4>
-                                <span class="text-xs bg-gray-700 px-2 py-0.5 rounded text-gray-300">${m.id}</span>
-                                <span class="text-xs bg-blue-900 text-blue-200 px-2 py-0.5 rounded">${m.size}</span>
+                                <h4 class="font-bold text-white text-lg">${escapeHtml(m.name)}</h4>
+                                <span class="text-xs bg-gray-700 px-2 py-0.5 rounded text-gray-300">${escapeHtml(m.id)}</span>
+                                <span class="text-xs bg-blue-900 text-blue-200 px-2 py-0.5 rounded">${escapeHtml(m.size)}</span>
                             </div>
-                            <p class="text-sm text-gray-400 mt-1">${m.desc}</p>
+                            <p class="text-sm text-gray-400 mt-1">${escapeHtml(m.desc)}</p>
                         </div>
-                        <button onclick="app.selectModelFromHub('${m.id}')" class="bg-purple-600 hover:bg-purple-700 text-white text-sm font-bold py-2 px-4 rounded transition whitespace-nowrap">Pull</button>
+                        <button data-hub-id="${escapeHtml(m.id)}" onclick="app.selectModelFromHub(this.dataset.hubId)" class="bg-purple-600 hover:bg-purple-700 text-white text-sm font-bold py-2 px-4 rounded transition whitespace-nowrap">Pull</button>
                     </div>
                  `).join('');
              }
@@ -292,9 +351,38 @@ const app = {
     async logout() { await this.api.post('/api/logout', {}); location.reload(); },
 
     async loadDashboard() {
-        this.loadModels(); this.refreshStats();
-        if (this.state.refreshInterval) clearInterval(this.state.refreshInterval);
-        this.state.refreshInterval = setInterval(() => { this.refreshStats(); this.loadModels(); }, 5000);
+        this.refreshDashboard();
+        if (!this.state.dashboardWs) this.connectDashboard();
+    },
+
+    // The server pushes a full snapshot on connect, then the sections that change; poll only while the socket is down.
+    connectDashboard() {
+        const ws = new WebSocket(`ws://${location.host}/ws/dashboard`);
+        this.state.dashboardWs = ws;
+        ws.onopen = () => {
+            if (this.state.refreshInterval) { clearInterval(this.state.refreshInterval); this.state.refreshInterval = null; }
+        };
+        ws.onmessage = (e) => this.applyDashboard(JSON.parse(e.data));
+        ws.onclose = (e) => {
+            this.state.dashboardWs = null;
+            if (e.code === 1008) return this.sessionExpired();
+            if (!this.state.refreshInterval) this.state.refreshInterval = setInterval(() => this.refreshDashboard(), 5000);
+            setTimeout(() => { if (!this.state.dashboardWs) this.connectDashboard(); }, 5000);
+        };
+    },
+
+    // 1008 means the session is gone; reconnecting or polling would only collect 401s, so hand over to the login view.
+    sessionExpired() {
+        if (this.state.refreshInterval) { clearInterval(this.state.refreshInterval); this.state.refreshInterval = null; }
+        this.ui.showView('login-view');
+    },
+
+    // Socket frames after the first carry only the sections that changed; HTTP responses carry all of them.
+    applyDashboard(d) {
+        if (d.stats) this.ui.renderDashboardStats(d.stats);
+        if (d.gpus) this.ui.renderGpuList(d.gpus);
+        if (d.system) this.ui.renderSystemInfo(d.system);
+        if (d.models) this.ui.renderModelList(this.sortModels(d.models));
     },
 
     async loadModels() {
@@ -306,7 +394,7 @@ const app = {
     },
 
     sortModels(models) {
-        const sort = document.getElementById('model-sort').value;
+        const sort = byId('model-sort').value;
         return models.sort((a, b) => {
             if (sort === 'date_desc') return b.id - a.id;
             if (sort === 'name_asc') return a.name.localeCompare(b.name);
@@ -322,11 +410,9 @@ const app = {
         });
     },
 
-    async refreshStats() {
-        try {
-            const [stats, gpus, sys] = await Promise.all([this.api.get('/api/dashboard/stats'), this.api.get('/api/gpus'), this.api.get('/api/system/info')]);
-            this.ui.renderDashboardStats(stats); this.ui.renderGpuList(gpus); this.ui.renderSystemInfo(sys);
-        } catch (e) { console.error(e); }
+    async refreshDashboard() {
+        try { this.applyDashboard(await this.api.get('/api/dashboard/all')); }
+        catch (e) { console.error(e); }
     },
 
     _listenToLogs(path, title) {
@@ -373,15 +459,16 @@ const app = {
         if(!confirm(`Kill ${pid}?`)) return;
         try {
             await this.api.post(`/api/gpus/kill/${pid}`, {});
-            alert('Killed'); this.refreshStats();
+            alert('Killed'); this.refreshDashboard();
         } catch(e) {
-            if(e.message.includes('Sudo') || e.message.includes('Permission')) {
+            // Only this error means a sudo retry can succeed; other 403s (Windows, already privileged) cannot.
+            if(e.message.includes('Sudo password required')) {
                 const pw = prompt('Sudo password required:');
                 if(pw) {
                     try {
                         const enc = await this.encryptPassword(pw);
                         await this.api.post(`/api/gpus/kill/${pid}`, {encrypted_sudo_password: enc});
-                        alert('Killed via sudo'); this.refreshStats();
+                        alert('Killed via sudo'); this.refreshDashboard();
                     } catch(e2) { alert(e2.message); }
                 }
             } else alert(e.message);
@@ -446,7 +533,7 @@ const app = {
             if(!res.ok) throw new Error('Load failed');
             const data = await res.json();
             this.ui.renderRecommendedModels(data);
-        } catch(e) { c.innerHTML = `<div class="text-center text-red-400 mt-4">${e.message}</div>`; }
+        } catch(e) { c.innerHTML = `<div class="text-center text-red-400 mt-4">${escapeHtml(e.message)}</div>`; }
     },
     async searchHub(reset=true, append=false) {
         const q = document.getElementById('browse-search').value.trim();
@@ -467,7 +554,7 @@ const app = {
             if(f) p.append('filter_type', f);
             const res = await this.api.get(`/api/hub/search?${p}`);
             this.ui.renderHubResults(res, append);
-        } catch(e) { c.innerHTML = `<div class="text-center text-red-400 mt-10">${e.message}</div>`; }
+        } catch(e) { c.innerHTML = `<div class="text-center text-red-400 mt-10">${escapeHtml(e.message)}</div>`; }
     },
     selectModelFromHub(id) {
         this.hideBrowseModal();
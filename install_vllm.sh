@@ -272,7 +272,7 @@ echo ""
 
 print_info "Installing FastAPI, Uvicorn, SQLAlchemy, Cryptography, and utilities..."
 # Added cryptography for secure password handling
-pip install fastapi uvicorn httpx psutil gputil pydantic sqlalchemy huggingface-hub cryptography --quiet
+pip install fastapi uvicorn uvloop httpx psutil gputil nvidia-ml-py orjson brotli pydantic sqlalchemy huggingface-hub hf_transfer cryptography --quiet
 if [ $? -eq 0 ]; then
     print_success "Management dependencies installed"
 else
@@ -42,9 +42,15 @@ if [ "$NEW_PASSWORD" != "$CONFIRM_PASSWORD" ]; then
     exit 1
 fi
 
-# Generate SHA256 hash
+# Generate salted PBKDF2 hash (same format as vllm_manager.hash_password); password goes via stdin, not argv
 echo "[*] Generating password hash..."
-PASSWORD_HASH=$(echo -n "$NEW_PASSWORD" | sha256sum | cut -d' ' -f1)
+PYTHON_BIN="python3"
+[ -x "venv/bin/python" ] && PYTHON_BIN="venv/bin/python"
+PASSWORD_HASH=$(printf '%s' "$NEW_PASSWORD" | "$PYTHON_BIN" -c 'import sys, hashlib, secrets; p = sys.stdin.read().encode(); s = secrets.token_bytes(16); n = 200000; print("$".join(["pbkdf2_sha256", str(n), s.hex(), hashlib.pbkdf2_hmac("sha256", p, s, n).hex()]))')
+if [ -z "$PASSWORD_HASH" ]; then
+    echo -e "${RED}[✗] Failed to generate password hash. Aborting.${NC}"
+    exit 1
+fi
 
 # Backup .env file
 cp "$ENV_FILE" "${ENV_FILE}.bak"
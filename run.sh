@@ -36,7 +36,7 @@ if [ -z "$VLLM_ADMIN_PASSWORD_HASH" ]; then
     echo ""
     echo "For production, please set a custom password:"
     echo "  1. Generate hash:"
-    echo -e "     ${BLUE}echo -n 'your_secure_password' | sha256sum${NC}"
+    echo -e "     ${BLUE}./reset_password.sh${NC}  (writes a salted PBKDF2 hash to .env)"
     echo "  2. Set environment variable:"
     echo -e "     ${BLUE}export VLLM_ADMIN_PASSWORD_HASH='your_hash_here'${NC}"
     echo ""
@@ -8,30 +8,38 @@ import json
 import os
 import subprocess
 import signal
+import socket
 import hashlib
+import hmac
+import gzip
 import secrets
 import shutil
 import sys
 import collections
-import csv
-import io
 import base64
+import importlib.util
+import re
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from threading import Thread
-import queue
+from typing import Dict, List, Optional, Any, Set, Tuple
+from datetime import datetime
+from threading import Thread, Lock, Event
 
 from fastapi import FastAPI, HTTPException, Depends, status, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 import httpx
 import psutil
 import GPUtil
-from sqlalchemy import create_engine, Column, Integer, String, Text, JSON, Float
+from sqlalchemy import create_engine, event, select, Column, Integer, String, Text, JSON, Float
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
+
+# hf_transfer is the Rust multi-connection downloader; huggingface_hub reads this flag at import time.
+HAS_HF_TRANSFER = importlib.util.find_spec("hf_transfer") is not None
+if HAS_HF_TRANSFER: os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 from huggingface_hub import snapshot_download, HfFolder, HfApi
 
 # Cryptography for secure sudo password handling
@@ -44,6 +52,29 @@ except ImportError:
     HAS_CRYPTO = False
     print("WARNING: 'cryptography' library not found. Secure password handling disabled.")
 
+# orjson is a faster drop-in for the stdlib json codec
+try:
+    import orjson
+    HAS_ORJSON = True
+    json_loads, json_dumps = orjson.loads, orjson.dumps
+except ImportError:
+    HAS_ORJSON = False
+    json_loads, json_dumps = json.loads, lambda o: json.dumps(o).encode()
+
+# Brotli shrinks the preloaded frontend assets further than gzip; optional
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# NVML bindings (nvidia-ml-py) for in-process GPU queries; falls back to nvidia-smi
+try:
+    import pynvml
+    HAS_NVML = True
+except ImportError:
+    HAS_NVML = False
+
 # ========================================================
 # Configuration
 # ========================================================
@@ -55,31 +86,63 @@ IS_PASSWORD_ENV_MANAGED = bool(ADMIN_PASSWORD_HASH_FROM_ENV)
 MODEL_DIR = Path(os.getenv("MODEL_DIR", "./models"))
 DATABASE_URL = "sqlite:///vllm_manager.db"
 SESSION_FILE = Path(".manager_sessions.json")
+RSA_KEY_FILE = Path(os.getenv("VLLM_RSA_KEY_FILE", str(MODEL_DIR / ".manager_rsa.pem")))
+RSA_KEY_PASSWORD = os.getenv("VLLM_RSA_KEY_PASSWORD")
 SESSION_TIMEOUT = 3600  # 1 hour
+SESSION_SWEEP_INTERVAL = 60  # seconds between purges of expired sessions
+SESSION_SAVE_DELAY = 0.5  # seconds; session mutations within this window share one file write
+HF_DOWNLOAD_WORKERS = int(os.getenv("HF_DOWNLOAD_WORKERS", 16))
+HF_ETAG_TIMEOUT = 30  # seconds per file metadata request; the hub default of 10 fails large repos on slow links
+WEIGHT_DUPLICATE_PATTERNS = ["pytorch_model*.bin"]  # skipped when the repo also has top-level safetensors main weights
+GPU_POLL_INTERVAL_SECONDS = float(os.getenv("GPU_POLL_INTERVAL_SECONDS", 5))
+DOWNLOAD_PROGRESS_INTERVAL = 10  # seconds between "downloaded so far" log lines
+REVISION_MARKER = ".hf_revision"  # commit sha of the snapshot stored in a model directory
+HEALTH_CHECK_TIMEOUT = 95  # seconds a starting model has to answer /v1/models
+STOP_TIMEOUT = 10  # seconds a model server gets to exit on SIGTERM before SIGKILL
+LOG_CACHE_BYTES = 64 * 1024  # per-model log history replayed to new subscribers
+LOG_FLUSH_INTERVAL = 0.03  # seconds; batches process output into ~30 WebSocket frames/s
+LOG_FRAME_CHARS = 64 * 1024  # upper bound on one batched log frame, so a backlog goes out in several moderate writes
+PROCESS_LINE_LIMIT = 1024 * 1024  # longest single stdout line read from a model server
 
 MODEL_DIR.mkdir(exist_ok=True)
 
 # ========================================================
-# Security: RSA Key Generation (Transient)
+# Security: RSA Key (persisted across restarts)
 # ========================================================
 rsa_private_key = None
 rsa_public_jwk = None
 
-if HAS_CRYPTO:
-    rsa_private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-        backend=default_backend()
+def load_or_create_rsa_key():
+    """Loads the manager's RSA key from RSA_KEY_FILE, generating and saving it (mode 0600) on first run."""
+    pw = RSA_KEY_PASSWORD.encode() if RSA_KEY_PASSWORD else None
+    if RSA_KEY_FILE.exists():
+        try:
+            return serialization.load_pem_private_key(RSA_KEY_FILE.read_bytes(), password=pw, backend=default_backend())
+        except Exception as e:
+            print(f"WARNING: Could not load RSA key from {RSA_KEY_FILE} ({e}), generating a new one.")
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048, backend=default_backend())
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.BestAvailableEncryption(pw) if pw else serialization.NoEncryption(),
     )
+    try:
+        fd = os.open(RSA_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f: f.write(pem)
+    except OSError as e:
+        print(f"WARNING: Could not persist RSA key to {RSA_KEY_FILE} ({e}).")
+    return key
+
+def int_to_base64(value: int) -> str:
+    """Unpadded base64url of a big-endian integer, as JWK expects."""
+    value_bytes = value.to_bytes((value.bit_length() + 7) // 8 or 1, "big")
+    return base64.urlsafe_b64encode(value_bytes).rstrip(b"=").decode("ascii")
+
+if HAS_CRYPTO:
+    rsa_private_key = load_or_create_rsa_key()
+    _OAEP_PADDING = padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
     
     pub_nums = rsa_private_key.public_key().public_numbers()
-    
-    def int_to_base64(value):
-        value_hex = format(value, 'x')
-        if len(value_hex) % 2 == 1:
-            value_hex = '0' + value_hex
-        value_bytes = bytes.fromhex(value_hex)
-        return base64.urlsafe_b64encode(value_bytes).decode('utf-8').rstrip('=')
 
     rsa_public_jwk = {
         "kty": "RSA",
@@ -94,16 +157,7 @@ def decrypt_password(encrypted_b64: str) -> str:
     if not HAS_CRYPTO or not rsa_private_key:
         raise Exception("Encryption not available on server.")
     try:
-        encrypted_bytes = base64.b64decode(encrypted_b64)
-        decrypted = rsa_private_key.decrypt(
-            encrypted_bytes,
-            padding.OAEP(
-                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None
-            )
-        )
-        return decrypted.decode('utf-8')
+        return rsa_private_key.decrypt(base64.b64decode(encrypted_b64), _OAEP_PADDING).decode('utf-8')
     except Exception as e:
         raise Exception("Decryption failed. Keys may have changed or data is corrupt.")
 
@@ -112,8 +166,17 @@ def decrypt_password(encrypted_b64: str) -> str:
 # Database Setup
 # ========================================================
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Keep SQLite connections open between requests (SQLAlchemy 1.4 defaults to NullPool for file databases).
+engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=QueuePool, pool_size=5, max_overflow=10)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, _):
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.close()
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 
@@ -122,6 +185,10 @@ class ModelType:
     EMBEDDING = "embedding"
 
 
+EMBEDDING_CONFIG_KEYS = ("pooling", "sentence_transformers", "embedding")
+_EMBEDDING_CONFIG_NEEDLES = tuple(f'"{k}"'.encode() for k in EMBEDDING_CONFIG_KEYS)
+
+
 class Model(Base):
     __tablename__ = "models"
     id = Column(Integer, primary_key=True, index=True)
@@ -136,6 +203,8 @@ class Model(Base):
     })
     download_status = Column(String, default="not_downloaded")
     size_gb = Column(Float, default=0.0)
+    revision = Column(String, nullable=True)
+    dir_mtime = Column(Float, nullable=True)
 
 
 class Setting(Base):
@@ -146,6 +215,19 @@ class Setting(Base):
 
 Base.metadata.create_all(bind=engine)
 
+SQL_IN_CHUNK = 500  # values per IN (...) list
+
+# Columns added after the first release; create_all never alters an existing table.
+MODEL_COLUMN_MIGRATIONS = {"revision": "VARCHAR", "dir_mtime": "FLOAT"}
+
+def migrate_schema():
+    with engine.begin() as conn:
+        cols = {r[1] for r in conn.exec_driver_sql("PRAGMA table_info(models)")}
+        for name, ddl in MODEL_COLUMN_MIGRATIONS.items():
+            if name not in cols: conn.exec_driver_sql(f"ALTER TABLE models ADD COLUMN {name} {ddl}")
+
+migrate_schema()
+
 
 def get_db():
     db = SessionLocal()
@@ -155,21 +237,40 @@ def get_db():
         db.close()
 
 
+_DEFAULT_PASSWORD_HASH = hashlib.sha256(b"admin123").hexdigest()
+_admin_hash_cache: Optional[dict] = None
+
 def get_admin_password_info(db: SessionLocal) -> dict:
+    """Returns the active admin hash and its source; the DB is only consulted until the next invalidation."""
+    global _admin_hash_cache
+    if _admin_hash_cache is not None:
+        return _admin_hash_cache
+
     if ADMIN_PASSWORD_HASH_FROM_ENV:
-        return {"hash": ADMIN_PASSWORD_HASH_FROM_ENV, "source": "env"}
+        _admin_hash_cache = {"hash": ADMIN_PASSWORD_HASH_FROM_ENV, "source": "env"}
+    elif password_setting := db.query(Setting).filter(Setting.key == "admin_password_hash").first():
+        _admin_hash_cache = {"hash": password_setting.value, "source": "db"}
+    else:
+        _admin_hash_cache = {"hash": _DEFAULT_PASSWORD_HASH, "source": "default"}
+    return _admin_hash_cache
 
-    password_setting = db.query(Setting).filter(Setting.key == "admin_password_hash").first()
-    if password_setting:
-        return {"hash": password_setting.value, "source": "db"}
+def invalidate_admin_password_cache():
+    global _admin_hash_cache
+    _admin_hash_cache = None
 
-    return {"hash": hashlib.sha256("admin123".encode()).hexdigest(), "source": "default"}
+async def admin_password_matches(password: str, db: SessionLocal) -> bool:
+    # Every check costs a full PBKDF2 derivation, so keep it off the event loop.
+    return await asyncio.to_thread(verify_password, password, get_admin_password_info(db)["hash"])
 
 
 # ========================================================
 # Pydantic Models
 # ========================================================
 
+# Response models are built once per request from trusted server state and never mutated.
+RESPONSE_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, protected_namespaces=())
+
+
 class ModelConfigUpdate(BaseModel):
     gpu_ids: str
     gpu_memory_utilization: float
@@ -182,6 +283,8 @@ class ModelConfigUpdate(BaseModel):
 
 
 class ModelStatus(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     hf_model_id: str
@@ -198,6 +301,8 @@ class ModelStatus(BaseModel):
 
 
 class GPUProcess(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     pid: int
     process_name: str
     gpu_memory_usage: float
@@ -205,16 +310,25 @@ class GPUProcess(BaseModel):
 
 
 class GPUInfo(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     memory_total_mb: int
     memory_used_mb: int
     utilization_percent: float
     temperature: Optional[float]
-    processes: List[GPUProcess] = []
+    processes: List[GPUProcess] = Field(default_factory=list)
+
+
+# Serialize whole response lists in one pydantic-core call instead of validate + dict + json.dumps per request.
+GPU_LIST_ADAPTER = TypeAdapter(List[GPUInfo])
+MODEL_LIST_ADAPTER = TypeAdapter(List[ModelStatus])
 
 
 class DashboardStats(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     total_models: int
     running_models: int
     system_cpu_percent: float
@@ -231,16 +345,29 @@ class PullModelRequest(BaseModel):
 
 
 class SystemInfo(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     vllm_version: str
     dev_mode: bool
 
 
+class DashboardSnapshot(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
+    stats: DashboardStats
+    models: List[ModelStatus]
+    gpus: List[GPUInfo]
+    system: SystemInfo
+
+
 class ChangePasswordRequest(BaseModel):
     current_password: str
     new_password: str
 
 
 class AdminSettings(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     is_password_env_managed: bool
     is_using_default_password: bool
 
@@ -252,36 +379,113 @@ class KillProcessRequest(BaseModel):
 # ========================================================
 # Log Broadcasting
 # ========================================================
+def log_frames(lines: List[str]) -> List[str]:
+    """Joins log lines into as few frames as possible, each at most LOG_FRAME_CHARS unless a single line is longer."""
+    frames, buf, size = [], [], 0
+    for line in lines:
+        if buf and size + len(line) > LOG_FRAME_CHARS:
+            frames.append("".join(buf)); buf, size = [], 0
+        buf.append(line); size += len(line)
+    if buf: frames.append("".join(buf))
+    return frames
+
 class LogBroadcaster:
+    """Fans process output out to WebSocket subscribers, coalescing lines pushed within LOG_FLUSH_INTERVAL into one frame."""
     def __init__(self):
-        self.subscribers: List[WebSocket] = []
-        self.log_cache = collections.deque(maxlen=200)
-        self._loop = asyncio.get_event_loop()
+        self.subscribers: Set[WebSocket] = set()
+        self.log_cache = bytearray()  # UTF-8 history, trimmed from the front to LOG_CACHE_BYTES
+        self._pending: List[str] = []
+        self._lock = Lock()
+        self._flush_scheduled = False
 
     async def subscribe(self, websocket: WebSocket):
-        self.subscribers.append(websocket)
+        self.subscribers.add(websocket)
         if self.log_cache:
-            await websocket.send_text("--- Log History ---\n" + "".join(self.log_cache))
+            await websocket.send_text("--- Log History ---\n" + self.log_cache.decode("utf-8", "replace"))
 
     def unsubscribe(self, websocket: WebSocket):
-        if websocket in self.subscribers:
-            self.subscribers.remove(websocket)
+        self.subscribers.discard(websocket)
 
     def push(self, message: str):
-        self.log_cache.append(message)
-        asyncio.run_coroutine_threadsafe(self._broadcast(message), self._loop)
+        with self._lock:
+            self.log_cache += message.encode()
+            if len(self.log_cache) > LOG_CACHE_BYTES:
+                # Deleting from the front of a bytearray is O(1); then drop the partial first line.
+                del self.log_cache[:len(self.log_cache) - LOG_CACHE_BYTES]
+                if (nl := self.log_cache.find(b"\n")) >= 0: del self.log_cache[:nl + 1]
+            self._pending.append(message)
+            if self._flush_scheduled: return
+            self._flush_scheduled = True
+        asyncio.run_coroutine_threadsafe(self._flush(), MAIN_LOOP)
+
+    async def _flush(self):
+        await asyncio.sleep(LOG_FLUSH_INTERVAL)
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._flush_scheduled = False
+        for frame in log_frames(batch): await self._broadcast(frame)
 
     async def _broadcast(self, message: str):
-        for sub in list(self.subscribers):
-            try:
-                await sub.send_text(message)
-            except Exception:
-                self.unsubscribe(sub)
+        subs = tuple(self.subscribers)
+        results = await asyncio.gather(*(sub.send_text(message) for sub in subs), return_exceptions=True)
+        for sub, r in zip(subs, results):
+            if isinstance(r, Exception): self.unsubscribe(sub)
+
+
+_log_ts = (0, "")
+
+def log_timestamp() -> str:
+    """HH:MM:SS for the current second, formatted at most once per second."""
+    global _log_ts
+    sec = int(time.time())
+    if sec != _log_ts[0]: _log_ts = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+    return _log_ts[1]
+
+
+class LogQueue:
+    """Log lines handed from a worker thread to a WebSocket; each wakeup drains everything pending. None ends the stream."""
+    def __init__(self):
+        self._items = collections.deque()
+        self._waiters: List[asyncio.Future] = []  # only touched on MAIN_LOOP
+
+    def put(self, item: Optional[str]):
+        self._items.append(item)
+        MAIN_LOOP.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        waiters, self._waiters = self._waiters, []
+        for w in waiters:
+            if not w.done(): w.set_result(None)
+
+    async def wait(self):
+        # The check and the future creation run without yielding, and put() wakes via the loop, so no item is missed.
+        while not self._items:
+            w = MAIN_LOOP.create_future(); self._waiters.append(w)
+            await w
+
+    def drain(self) -> List[Optional[str]]:
+        items = []
+        while self._items: items.append(self._items.popleft())
+        return items
+
+
+async def stream_log_queue(ws: WebSocket, q: LogQueue):
+    while True:
+        await q.wait()
+        items = q.drain()
+        if None not in items:
+            # Let a burst of output accumulate briefly so it goes out as one frame.
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            items += q.drain()
+        for frame in log_frames([i for i in items if i is not None]): await ws.send_text(frame)
+        if None in items: return
 
 
 # ========================================================
 # App Setup & Global State
 # ========================================================
+# No default_response_class override: FastAPI's pydantic-core serialization is already fast and ORJSONResponse is
+# deprecated upstream; the hot endpoints return TypeAdapter.dump_json bytes directly.
 app = FastAPI(title="vLLM Manager Pro", version="3.4.1")
 app.add_middleware(
     CORSMiddleware,
@@ -291,95 +495,270 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+MAIN_LOOP: Optional[asyncio.AbstractEventLoop] = None  # set on startup; target for callbacks from worker threads
 running_models: Dict[int, dict] = {}
 model_states: Dict[int, dict] = {}
 sessions: Dict[str, dict] = {}
+_sessions_dirty: Optional[asyncio.Event] = None  # created on startup; set whenever sessions needs persisting
 download_tasks: Dict[int, dict] = {}
 upgrade_task: Dict = {}
+deleting_models: Set[int] = set()  # ids with a live delete_model_task; a "deleting" row without one was interrupted
 log_broadcasters: Dict[int, LogBroadcaster] = {}
+background_tasks: List[asyncio.Task] = []
+dashboard_clients: Dict[WebSocket, dict] = {}  # /ws/dashboard subscribers -> {"token": session token, "sent": sections last sent}
+# Indexes over running_models (plus ports reserved by models still starting), kept in sync by the helpers below.
+used_ports: Set[int] = set()
+pid_to_model: Dict[int, int] = {}
+
+def register_running_model(model_id: int, info: dict):
+    running_models[model_id] = info
+    pid_to_model[info["pid"]] = model_id
+    used_ports.add(info["port"])
+    invalidate_gpu_snapshot()
+
+def unregister_running_model(model_id: int) -> Optional[dict]:
+    info = running_models.pop(model_id, None)
+    if info:
+        pid_to_model.pop(info["pid"], None)
+        used_ports.discard(info["port"])
+        invalidate_gpu_snapshot()
+    return info
+
+def on_model_exit(model_id: int, pid: int, returncode: int):
+    """Drops a model whose process exited on its own; models stopped via the API are already unregistered."""
+    info = running_models.get(model_id)
+    if info and info["pid"] == pid:
+        unregister_running_model(model_id)
+        model_states[model_id] = {"status": "error", "message": f"Process exited unexpectedly (code {returncode})."}
 
 # ========================================================
 # Authentication & Sessions
 # ========================================================
-# ... (Same as before) ...
-def hash_password(p: str) -> str:
-    return hashlib.sha256(p.encode()).hexdigest()
+PBKDF2_PREFIX = "pbkdf2_sha256"
+PBKDF2_ITERATIONS = 200_000
 
-def save_sessions():
-    with open(SESSION_FILE, "w") as f:
-        json.dump(sessions, f)
+def hash_password(p: str) -> str:
+    """Salted PBKDF2-SHA256, stored as pbkdf2_sha256$<iterations>$<salt hex>$<digest hex>."""
+    salt = secrets.token_bytes(16)
+    return f"{PBKDF2_PREFIX}${PBKDF2_ITERATIONS}${salt.hex()}${hashlib.pbkdf2_hmac('sha256', p.encode(), salt, PBKDF2_ITERATIONS).hex()}"
+
+def is_legacy_hash(stored: str) -> bool:
+    return not stored.startswith(PBKDF2_PREFIX + "$")
+
+def verify_password(p: str, stored: str) -> bool:
+    """Checks p against a PBKDF2 hash or a bare SHA-256 hex digest (env-provided or pre-PBKDF2 installs).
+    Deliberately not memoized: a cache would keep plaintext guesses in memory and make repeated guesses measurably faster."""
+    if is_legacy_hash(stored):
+        candidate, expected = hashlib.sha256(p.encode()).hexdigest(), stored
+    else:
+        try:
+            _, iterations, salt, expected = stored.split("$")
+            candidate = hashlib.pbkdf2_hmac("sha256", p.encode(), bytes.fromhex(salt), int(iterations)).hex()
+        except ValueError: return False
+    return hmac.compare_digest(candidate.encode(), expected.encode())
+
+# Sessions live in memory; mutations only mark them dirty and session_writer persists them in the background.
+
+def save_sessions(snapshot: Optional[dict] = None):
+    tmp = SESSION_FILE.with_name(SESSION_FILE.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(json_dumps(sessions if snapshot is None else snapshot))
+        # Flush to disk before the rename, or a crash can leave an empty sessions file behind.
+        f.flush(); os.fsync(f.fileno())
+    os.replace(tmp, SESSION_FILE)
+
+def mark_sessions_dirty():
+    if _sessions_dirty is not None: _sessions_dirty.set()
+
+async def session_writer():
+    while True:
+        await _sessions_dirty.wait()
+        await asyncio.sleep(SESSION_SAVE_DELAY)
+        _sessions_dirty.clear()
+        try: await asyncio.to_thread(save_sessions, dict(sessions))
+        except OSError as e: print(f"Failed to save sessions: {e}")
+
+async def session_sweeper():
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL)
+        now = time.time()
+        expired = [t for t, s in sessions.items() if s["expires"] <= now]
+        for t in expired: del sessions[t]
+        if expired: mark_sessions_dirty()
 
 def load_sessions():
     global sessions
     if SESSION_FILE.exists():
-        with open(SESSION_FILE, "r") as f:
-            sessions = json.load(f)
+        loaded = json_loads(SESSION_FILE.read_bytes())
+        for s in loaded.values():
+            # Session files from older versions store expiries as ISO strings.
+            if isinstance(s["expires"], str): s["expires"] = datetime.fromisoformat(s["expires"]).timestamp()
+        now = time.time()
+        sessions = {t: s for t, s in loaded.items() if s["expires"] > now}
 
 def create_session(u: str) -> str:
     token = secrets.token_urlsafe(32)
     sessions[token] = {
         "username": u,
-        "created": datetime.now().isoformat(),
-        "expires": (datetime.now() + timedelta(seconds=SESSION_TIMEOUT)).isoformat(),
+        "created": time.time(),
+        "expires": time.time() + SESSION_TIMEOUT,
     }
-    save_sessions()
+    mark_sessions_dirty()
     return token
 
+def session_user(t: Optional[str]) -> Optional[str]:
+    """Username for a live session token, from a single dict lookup and float compare."""
+    # Expired entries are left for session_sweeper; no mutation on the request path.
+    s = sessions.get(t) if t else None
+    return s["username"] if s is not None and s["expires"] > time.time() else None
+
 def verify_session(t: Optional[str]) -> bool:
-    if not t or t not in sessions:
-        return False
-    if datetime.now() > datetime.fromisoformat(sessions[t]["expires"]):
-        del sessions[t]
-        save_sessions()
-        return False
-    return True
+    return session_user(t) is not None
 
 async def get_current_user(r: Request):
     token = r.cookies.get("session_token")
-    if not verify_session(token):
+    if (u := session_user(token)) is None:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid session")
-    return sessions[token]["username"]
+    return u
 
 
 # ========================================================
 # Background Tasks & Utilities
 # ========================================================
 
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive client for probing local vLLM servers."""
+    global _http_client
+    if _http_client is None:
+        # trust_env=False: probes only hit 127.0.0.1, so never route them through a proxy or consult .netrc.
+        _http_client = httpx.AsyncClient(timeout=httpx.Timeout(2.0, connect=0.5), limits=httpx.Limits(max_keepalive_connections=64, keepalive_expiry=30), trust_env=False)
+    return _http_client
+
+# Fixed parts of the vLLM server command line, built once; only per-model values are filled in at start.
+VLLM_BASE_CMD = (sys.executable, "-m", "vllm.entrypoints.openai.api_server", "--host", "0.0.0.0")
+VLLM_VALUE_FLAGS = (("gpu_memory_utilization", "--gpu-memory-utilization"), ("tensor_parallel_size", "--tensor-parallel-size"), ("max_model_len", "--max-model-len"), ("dtype", "--dtype"), ("quantization", "--quantization"))
+VLLM_SWITCH_FLAGS = (("trust_remote_code", "--trust-remote-code"), ("enable_prefix_caching", "--enable-prefix-caching"))
+
+def build_vllm_command(path, name: str, port: int, cfg: dict) -> List[str]:
+    cmd = [*VLLM_BASE_CMD, "--model", str(path), "--served-model-name", name, "--port", str(port)]
+    for key, flag in VLLM_VALUE_FLAGS:
+        if (v := cfg.get(key)) not in (None, ""): cmd += (flag, str(v))
+    cmd += [flag for key, flag in VLLM_SWITCH_FLAGS if cfg.get(key)]
+    return cmd
+
+async def pump_process_output(model_id, process, broadcaster):
+    """Forwards a model server's output to its broadcaster from the event loop, then reports the exit."""
+    # Never stop reading before EOF: once the 64 KiB pipe fills, the server blocks on its next write.
+    while True:
+        try: line = await process.stdout.readline()
+        except ValueError:
+            # The reader has already discarded the over-long line (> PROCESS_LINE_LIMIT).
+            broadcaster.push("[manager] output line too long, skipped\n"); continue
+        if not line: break
+        try: broadcaster.push(line.decode("utf-8", "replace"))
+        except Exception as e: print(f"Log push failed for model {model_id}: {e}")
+    await process.wait()
+    on_model_exit(model_id, process.pid, process.returncode)
+
+async def terminate_process_group(process, timeout: float = STOP_TIMEOUT):
+    """SIGTERMs a model server's process group and waits for it to exit, escalating to SIGKILL after timeout."""
+    # Model servers are started in a new session, so the group id is the leader's pid even after the leader is reaped.
+    try: os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError: return
+    try: await asyncio.wait_for(process.wait(), timeout)
+    except asyncio.TimeoutError:
+        try: os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError: return
+        await process.wait()
+
+async def stop_all_models():
+    """Stops every model server, running or still starting; they run in their own session, so Ctrl+C never reaches them."""
+    targets = [(i["name"], i["process"]) for i in map(unregister_running_model, tuple(running_models))]
+    # Starting servers are only known to model_states and their health_check_task, which shutdown does not await.
+    for mid, st in tuple(model_states.items()):
+        if "process" in st: targets.append((f"model {mid} (starting)", st["process"])); del model_states[mid]
+    # Stops overlap, so shutdown takes as long as the slowest model rather than the sum.
+    results = await asyncio.gather(*(terminate_process_group(p) for _, p in targets), return_exceptions=True)
+    for (name, _), r in zip(targets, results):
+        if isinstance(r, Exception): print(f"Failed to stop '{name}': {r}")
+
 async def health_check_task(model_id, port, process, model_name, gpu_ids, broadcaster):
+    # Waiting on this instead of a plain sleep reports a crashed server as soon as it exits.
+    exited = asyncio.ensure_future(process.wait())
     try:
-        await asyncio.sleep(5)
-        if process.poll() is not None:
-            raise RuntimeError("Process died unexpectedly.")
-        async with httpx.AsyncClient() as client:
-            for _ in range(45):
-                if process.poll() is not None:
-                    raise RuntimeError("Process terminated during health checks.")
-                try:
-                    res = await client.get(f"http://127.0.0.1:{port}/v1/models", timeout=2.0)
-                    if res.status_code == 200:
-                        data = res.json()
-                        model_names_in_response = [m["id"] for m in data.get("data", [])]
-                        if model_name in model_names_in_response:
-                            running_models[model_id] = {"process": process, "pid": process.pid, "port": port, "gpu_ids": gpu_ids, "name": model_name}
-                            if model_id in model_states: del model_states[model_id]
-                            print(f"Model '{model_name}' (ID: {model_id}) started successfully.")
-                            broadcaster.push("---START SUCCESS---")
-                            return
-                except httpx.RequestError: pass
-                await asyncio.sleep(2)
+        client = get_http_client()
+        deadline = time.monotonic() + HEALTH_CHECK_TIMEOUT
+        delay = 0.25
+        while time.monotonic() < deadline:
+            if model_states.get(model_id, {}).get("process") is not process:
+                # Our start was dropped (stopped, error cleared, ...); whoever did it may not have stopped the server.
+                await terminate_process_group(process); used_ports.discard(port)
+                return
+            if exited.done():
+                raise RuntimeError("Process terminated during health checks.")
+            try:
+                res = await client.get(f"http://127.0.0.1:{port}/v1/models")
+                if res.status_code == 200:
+                    data = res.json()
+                    model_names_in_response = [m["id"] for m in data.get("data", [])]
+                    if model_name in model_names_in_response:
+                        # Dropped while this request was in flight: the next loop pass tears the server down.
+                        if model_states.get(model_id, {}).get("process") is not process: continue
+                        register_running_model(model_id, {"process": process, "pid": process.pid, "port": port, "gpu_ids": gpu_ids, "name": model_name})
+                        if model_id in model_states: del model_states[model_id]
+                        print(f"Model '{model_name}' (ID: {model_id}) started successfully.")
+                        broadcaster.push("---START SUCCESS---")
+                        return
+            except httpx.RequestError: pass
+            await asyncio.wait((exited,), timeout=delay)
+            delay = min(1.0, delay * 1.5)
         raise RuntimeError("Health check timed out.")
     except Exception as e:
-        if process.poll() is None:
-            try: os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-            except: pass
-        model_states[model_id] = {"status": "error", "message": str(e)}
-        print(f"Error starting model: {str(e)}")
-        broadcaster.push(f"---START FAILURE---\n{str(e)}")
+        # Only report failures of a start nobody has cancelled or superseded.
+        if model_states.get(model_id, {}).get("process") is process:
+            model_states[model_id] = {"status": "error", "message": str(e)}
+            print(f"Error starting model: {str(e)}")
+            broadcaster.push(f"---START FAILURE---\n{str(e)}")
+        try: await terminate_process_group(process)
+        except Exception: pass
+        used_ports.discard(port)
+    finally:
+        exited.cancel()
+
+def dir_size(path) -> int:
+    """Total size in bytes of regular files under path; DirEntry caches the d_type so directories cost no extra stat."""
+    total, stack = 0, [path]
+    # An explicit stack instead of recursion: no frame per directory and no recursion limit on deep trees.
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False): stack.append(e.path)
+                        elif e.is_file(follow_symlinks=False): total += e.stat(follow_symlinks=False).st_size
+                    except OSError: continue
+        except OSError: continue
+    return total
+
+def is_embedding_config(config_path) -> bool:
+    """True if config.json has a top-level embedding marker; the JSON is only parsed when a raw byte scan finds a candidate key."""
+    raw = Path(config_path).read_bytes()
+    if not any(n in raw for n in _EMBEDDING_CONFIG_NEEDLES): return False
+    return any(k in json_loads(raw) for k in EMBEDDING_CONFIG_KEYS)
+
+def report_download_progress(path, done: Event, log):
+    while not done.wait(DOWNLOAD_PROGRESS_INTERVAL):
+        log(f"Downloaded {dir_size(path) / 1024**3:.2f} GB so far...")
+
+def has_safetensors_weights(rfilename: str) -> bool:
+    return "/" not in rfilename and rfilename.startswith("model") and (rfilename.endswith(".safetensors") or rfilename == "model.safetensors.index.json")
 
 def download_model_task(db_id, hf_model_id, model_name):
-    log_q = queue.Queue()
+    log_q = LogQueue()
     download_tasks[db_id] = {"log_queue": log_q}
-    def log(m): log_q.put(f"[{datetime.now().strftime('%H:%M:%S')}] {m}\n")
+    def log(m): log_q.put(f"[{log_timestamp()}] {m}\n")
     try:
         db = SessionLocal()
         model = db.query(Model).filter(Model.id == db_id).first()
@@ -388,18 +767,39 @@ def download_model_task(db_id, hf_model_id, model_name):
         model.download_status = "downloading"
         db.commit()
         model_path = MODEL_DIR / model_name
-        snapshot_download(repo_id=hf_model_id, local_dir=model_path, local_dir_use_symlinks=False, token=HfFolder.get_token())
-        log("Download complete.")
-        total_size = sum(f.stat().st_size for f in model_path.glob("**/*") if f.is_file())
+        token = HfFolder.get_token()
+        revision, ignore = None, None
+        try:
+            info = HfApi().model_info(hf_model_id, token=token)
+            revision = info.sha
+            # Repos that ship safetensors main weights often carry them again as pytorch_model*.bin; vLLM loads the former.
+            # Only top-level model*.safetensors counts: adapters or subfolder files do not replace the main weights.
+            if any(has_safetensors_weights(f.rfilename) for f in info.siblings or ()):
+                ignore = WEIGHT_DUPLICATE_PATTERNS
+                log("Safetensors weights found, skipping duplicate .bin weights.")
+        except Exception as e: log(f"Could not resolve remote revision ({e}), downloading latest.")
+        marker = model_path / REVISION_MARKER
+        if revision and marker.exists() and marker.read_text().strip() == revision:
+            log(f"Revision {revision[:12]} is already on disk, skipping download.")
+        else:
+            done = Event()
+            Thread(target=report_download_progress, args=(model_path, done, log), daemon=True).start()
+            try:
+                snapshot_download(repo_id=hf_model_id, revision=revision, local_dir=model_path, local_dir_use_symlinks=False, token=token, max_workers=HF_DOWNLOAD_WORKERS, etag_timeout=HF_ETAG_TIMEOUT, ignore_patterns=ignore)
+            finally:
+                done.set()
+            if revision: marker.write_text(revision)
+            log("Download complete.")
+        model.revision = revision
+        total_size = dir_size(model_path)
         model.download_status = "completed"
         model.path = str(model_path)
         model.size_gb = total_size / (1024 ** 3)
+        model.dir_mtime = model_path.stat().st_mtime
         config_path = model_path / "config.json"
-        if config_path.exists():
-            with open(config_path) as f:
-                if any(k in json.load(f) for k in ["pooling", "sentence_transformers", "embedding"]):
-                    model.model_type = ModelType.EMBEDDING
-                    log("Detected embedding model.")
+        if config_path.exists() and is_embedding_config(config_path):
+            model.model_type = ModelType.EMBEDDING
+            log("Detected embedding model.")
         db.commit()
         model_states.pop(db_id, None)
     except Exception as e:
@@ -415,10 +815,38 @@ def download_model_task(db_id, hf_model_id, model_name):
         log_q.put(None)
         if "db" in locals() and db.is_active: db.close()
 
+def delete_model_task(model_id: int, path: Optional[str]):
+    """Removes a model's files, then its row; runs in a thread since rmtree on a large model is seconds of unlinks."""
+    db = SessionLocal()
+    try:
+        try:
+            if path and Path(path).exists(): shutil.rmtree(path)
+        except OSError as e:
+            # Not "error": clearing that marks a model completed, and this tree is partly gone. DELETE can be retried.
+            db.query(Model).filter(Model.id == model_id).update({"download_status": "delete_failed"}); db.commit()
+            model_states[model_id] = {"status": "error", "message": f"Delete failed: {e}"}
+            return
+        db.query(Model).filter(Model.id == model_id).delete(); db.commit()
+        model_states.pop(model_id, None)
+    finally:
+        db.close()
+        deleting_models.discard(model_id)
+
+def start_model_delete(model_id: int, path: Optional[str]):
+    deleting_models.add(model_id)
+    Thread(target=delete_model_task, args=(model_id, path)).start()
+
+def resume_interrupted_deletes():
+    """Restarts deletes cut short by a shutdown, so their rows do not stay "deleting" forever."""
+    db = SessionLocal()
+    try: rows = db.execute(select(Model.id, Model.path).where(Model.download_status == "deleting")).all()
+    finally: db.close()
+    for r in rows: start_model_delete(r.id, r.path)
+
 def upgrade_vllm_task():
-    log_q = queue.Queue()
+    log_q = LogQueue()
     upgrade_task["log_queue"] = log_q
-    def log(m): log_q.put(f"[{datetime.now().strftime('%H:%M:%S')}] {m}\n")
+    def log(m): log_q.put(f"[{log_timestamp()}] {m}\n")
     try:
         log("Starting vLLM upgrade...")
         venv_python = sys.executable
@@ -442,52 +870,216 @@ def upgrade_vllm_task():
         log_q.put(None)
         upgrade_task.clear()
 
+INSTALL_INFO_PATH = Path(__file__).parent.resolve() / ".install_info"
+_VLLM_VERSION_RE = re.compile(r"^VLLM_VERSION=(\S+)", re.M)
+_sysinfo_cache = {"mtime": None, "val": (False, "Unknown")}
+
 def get_system_info_sync():
-    install_info_path = Path(__file__).parent.resolve() / ".install_info"
-    dev = False; ver = "Unknown"
-    if install_info_path.exists():
-        with open(install_info_path) as f:
-            for l in f:
-                if "DEV_MODE=true" in l: dev = True
-                if l.startswith("VLLM_VERSION="): ver = l.strip().split("=")[1]
-    return dev, ver
-
-def find_available_port(start=8000):
-    p = start
-    while p in {i["port"] for i in running_models.values()}: p += 1
-    return p
-
-def get_gpu_processes_from_nvidia_smi() -> Dict[int, List[dict]]:
-    gpu_map = {}; processes = collections.defaultdict(list)
+    """Parses .install_info, re-reading it only when its mtime changes (e.g. after an upgrade)."""
+    try: mtime = INSTALL_INFO_PATH.stat().st_mtime_ns
+    except OSError: return False, "Unknown"
+    if _sysinfo_cache["mtime"] != mtime:
+        data = INSTALL_INFO_PATH.read_text()
+        ver = m.group(1) if (m := _VLLM_VERSION_RE.search(data)) else "Unknown"
+        _sysinfo_cache["val"] = ("DEV_MODE=true" in data, ver)
+        _sysinfo_cache["mtime"] = mtime
+    return _sysinfo_cache["val"]
+
+def find_available_port() -> int:
+    """Lets the kernel pick a free port, so ports held by unmanaged processes are never handed out."""
+    while True:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("", 0))  # vLLM listens on 0.0.0.0, so probe the same address
+            port = s.getsockname()[1]
+        # A port reserved by a model that has not bound it yet looks free to the kernel.
+        if port not in used_ports: return port
+
+# One GPU (plus host CPU/memory) snapshot shared by every request, refreshed by gpu_poller or on demand once stale.
+gpu_cache = {"ts": 0.0, "gpus": [], "procs": {}, "cpu": 0.0, "mem": 0.0}
+_gpu_refresh_lock: Optional[asyncio.Lock] = None  # created on startup (Python 3.9 binds locks to the loop at creation)
+_nvml_handles: List[Any] = []
+_nvml_names: List[str] = []  # device names never change at runtime, so they are read once in init_nvml
+
+def init_nvml() -> bool:
+    global _nvml_handles, _nvml_names
+    if not HAS_NVML: return False
     try:
-        res_map = subprocess.run(["nvidia-smi", "--query-gpu=index,uuid", "--format=csv,noheader,nounits"], capture_output=True, text=True)
-        if res_map.returncode == 0:
-            for r in csv.reader(io.StringIO(res_map.stdout)):
-                if len(r) >= 2: gpu_map[r[1].strip()] = int(r[0].strip())
+        pynvml.nvmlInit()
+        _nvml_handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+        _nvml_names = [n.decode() if isinstance(n, bytes) else n for n in map(pynvml.nvmlDeviceGetName, _nvml_handles)]
+        return True
+    except pynvml.NVMLError as e:
+        print(f"NVML unavailable ({e}), falling back to nvidia-smi.")
+        _nvml_handles = []
+        return False
+
+_proc_names: Dict[int, str] = {}  # pid -> name for processes seen on a GPU at the last poll
+HAS_PROCFS = os.path.isdir("/proc/self")
+
+def _read_proc_name(pid: int) -> str:
+    """Name from /proc directly: comm, or argv[0] when comm was cut at the kernel's 15-character limit."""
+    with open(f"/proc/{pid}/comm", "rb") as f: name = f.read().rstrip(b"\n")
+    if len(name) >= 15:
+        with open(f"/proc/{pid}/cmdline", "rb") as f: argv0 = os.path.basename(f.read().split(b"\0", 1)[0])
+        if argv0.startswith(name): name = argv0
+    return name.decode("utf-8", "replace")
+
+def _process_name(pid: int) -> str:
+    if (name := _proc_names.get(pid)) is None:
+        try: name = _read_proc_name(pid) if HAS_PROCFS else psutil.Process(pid).name()
+        except (OSError, psutil.Error): name = "unknown"
+        _proc_names[pid] = name
+    return name
+
+def _query_nvml() -> Dict[int, List[dict]]:
+    processes = collections.defaultdict(list)
+    for idx, h in enumerate(_nvml_handles):
+        for p in pynvml.nvmlDeviceGetComputeRunningProcesses(h):
+            processes[idx].append({"pid": p.pid, "process_name": _process_name(p.pid), "gpu_memory_usage": (p.usedGpuMemory or 0) / 1024**2})
+    # Forget pids that left the GPUs so a recycled pid is looked up afresh.
+    seen = {p["pid"] for procs in processes.values() for p in procs}
+    for pid in _proc_names.keys() - seen: del _proc_names[pid]
+    return processes
+
+_smi_gpu_map: Dict[str, int] = {}  # uuid -> index; the GPU set is fixed for the life of the process, so one nvidia-smi call fills it
+
+def _query_nvidia_smi() -> Dict[int, List[dict]]:
+    gpu_map = _smi_gpu_map; processes = collections.defaultdict(list)
+    try:
+        if not gpu_map:
+            res_map = subprocess.run(["nvidia-smi", "--query-gpu=index,uuid", "--format=csv,noheader,nounits"], capture_output=True, text=True)
+            if res_map.returncode == 0:
+                for l in res_map.stdout.splitlines():
+                    r = l.split(",")
+                    if len(r) >= 2: gpu_map[r[1].strip()] = int(r[0])
         res_apps = subprocess.run(["nvidia-smi", "--query-compute-apps=pid,process_name,gpu_uuid,used_memory", "--format=csv,noheader,nounits"], capture_output=True, text=True)
         if res_apps.returncode == 0:
-            for r in csv.reader(io.StringIO(res_apps.stdout)):
-                if len(r) >= 4:
-                    try:
-                        pid, name, uuid, mem = int(r[0]), r[1].strip(), r[2].strip(), float(r[3] or 0)
-                        idx = gpu_map.get(uuid)
-                        if idx is not None: processes[idx].append({"pid": pid, "process_name": name, "gpu_memory_usage": mem})
-                    except: continue
+            for l in res_apps.stdout.splitlines():
+                try:
+                    # Process names may contain commas; pid is first, uuid and memory are last.
+                    pid, rest = l.split(",", 1)
+                    name, uuid, mem = rest.rsplit(",", 2)
+                    idx = gpu_map.get(uuid.strip())
+                    if idx is not None: processes[idx].append({"pid": int(pid), "process_name": name.strip(), "gpu_memory_usage": float(mem.strip() or 0)})
+                except: continue
     except: pass
     return processes
 
+def _query_gpu_processes() -> Dict[int, List[dict]]:
+    if _nvml_handles:
+        try: return _query_nvml()
+        except pynvml.NVMLError: pass
+    return _query_nvidia_smi()
+
+def _query_gpus_nvml() -> List[dict]:
+    res = []
+    for idx, (h, name) in enumerate(zip(_nvml_handles, _nvml_names)):
+        mem = pynvml.nvmlDeviceGetMemoryInfo(h)
+        res.append({
+            "id": idx, "name": name,
+            "memory_total_mb": mem.total // 1024**2, "memory_used_mb": mem.used // 1024**2,
+            "utilization_percent": float(pynvml.nvmlDeviceGetUtilizationRates(h).gpu),
+            "temperature": float(pynvml.nvmlDeviceGetTemperature(h, pynvml.NVML_TEMPERATURE_GPU)),
+        })
+    return res
+
+def _query_gpus_gputil() -> List[dict]:
+    try:
+        return [{"id": g.id, "name": g.name, "memory_total_mb": int(g.memoryTotal), "memory_used_mb": int(g.memoryUsed), "utilization_percent": float(g.load*100), "temperature": g.temperature} for g in GPUtil.getGPUs()]
+    except: return []
+
+def query_gpus() -> List[dict]:
+    if _nvml_handles:
+        try: return _query_gpus_nvml()
+        except pynvml.NVMLError: pass
+    return _query_gpus_gputil()
+
+def _read_gpu_state():
+    # cpu_percent(None) is non-blocking: it reports usage since the previous call, i.e. over one poll interval.
+    return query_gpus(), _query_gpu_processes(), psutil.cpu_percent(None), psutil.virtual_memory().percent
+
+async def get_gpu_snapshot(max_age: float = GPU_POLL_INTERVAL_SECONDS) -> dict:
+    """Returns the shared GPU snapshot, refreshing it in a worker thread if older than max_age."""
+    async with _gpu_refresh_lock:
+        if time.monotonic() - gpu_cache["ts"] >= max_age:
+            gpus, procs, cpu, mem = await asyncio.to_thread(_read_gpu_state)
+            gpu_cache.update(ts=time.monotonic(), gpus=gpus, procs=procs, cpu=cpu, mem=mem)
+    return gpu_cache
+
+def invalidate_gpu_snapshot():
+    gpu_cache["ts"] = 0.0
+
+async def gpu_poller():
+    while True:
+        try: await get_gpu_snapshot(max_age=0)
+        except Exception as e: print(f"GPU poll failed: {e}")
+        await asyncio.sleep(GPU_POLL_INTERVAL_SECONDS)
+
+CAP_KILL = 5  # bit in /proc/<pid>/status CapEff
+
+def can_kill_any() -> bool:
+    """True when running as root or with CAP_KILL, in which case a sudo retry can never succeed where os.kill failed."""
+    if os.name == "nt": return False
+    if os.geteuid() == 0: return True
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("CapEff:"): return bool(int(line.split()[1], 16) >> CAP_KILL & 1)
+    except (OSError, ValueError): pass
+    return False
+
+CAN_KILL_ANY = can_kill_any()
+SUDO_KILL_TIMEOUT = 10  # seconds
+
+def sudo_kill(pid: int, password: str):
+    with subprocess.Popen(["sudo", "-S", "-p", "", "kill", "-9", str(pid)], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as p:
+        try: _, err = p.communicate(password.encode() + b"\n", timeout=SUDO_KILL_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            p.kill(); raise RuntimeError("sudo timed out")
+    if p.returncode: raise RuntimeError(err.decode(errors="replace").strip() or f"exit code {p.returncode}")
+
 
 # ========================================================
 # API Endpoints
 # ========================================================
 
 @app.on_event("startup")
-async def startup_event(): load_sessions()
+async def startup_event():
+    global MAIN_LOOP, _gpu_refresh_lock, _sessions_dirty
+    MAIN_LOOP = asyncio.get_running_loop()
+    _gpu_refresh_lock = asyncio.Lock()
+    _sessions_dirty = asyncio.Event()
+    load_sessions()
+    init_nvml()
+    psutil.cpu_percent(None)  # primes the counter so the first snapshot has a real interval
+    resume_interrupted_deletes()
+    background_tasks.append(asyncio.create_task(gpu_poller()))
+    background_tasks.append(asyncio.create_task(session_writer()))
+    background_tasks.append(asyncio.create_task(session_sweeper()))
+    background_tasks.append(asyncio.create_task(dashboard_pusher()))
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    for t in background_tasks: t.cancel()
+    await stop_all_models()
+    save_sessions()
+    if _http_client is not None: await _http_client.aclose()
+    if _nvml_handles:
+        try: pynvml.nvmlShutdown()
+        except pynvml.NVMLError: pass
 
 @app.post("/api/login")
 async def login(req: LoginRequest, db: SessionLocal = Depends(get_db)):
-    if req.username != ADMIN_USERNAME or hash_password(req.password) != get_admin_password_info(db)["hash"]:
+    # Both checks always run and compare in constant time, so timing reveals neither which one failed nor how far it matched.
+    user_ok = hmac.compare_digest(req.username.encode(), ADMIN_USERNAME.encode())
+    if not (await admin_password_matches(req.password, db) & user_ok):
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
+    info = get_admin_password_info(db)
+    if info["source"] == "db" and is_legacy_hash(info["hash"]):
+        # Re-hash a pre-PBKDF2 password now that we have the plaintext.
+        new_hash = await asyncio.to_thread(hash_password, req.password)
+        db.query(Setting).filter(Setting.key == "admin_password_hash").update({"value": new_hash}); db.commit()
+        invalidate_admin_password_cache()
     token = create_session(req.username)
     res = JSONResponse({"success": True})
     res.set_cookie("session_token", token, httponly=True, max_age=SESSION_TIMEOUT, samesite="lax")
@@ -496,7 +1088,7 @@ async def login(req: LoginRequest, db: SessionLocal = Depends(get_db)):
 @app.post("/api/logout")
 async def logout(request: Request):
     if t := request.cookies.get("session_token"):
-        if t in sessions: del sessions[t]; save_sessions()
+        if sessions.pop(t, None): mark_sessions_dirty()
     res = JSONResponse({"success": True})
     res.delete_cookie("session_token")
     return res
@@ -504,65 +1096,98 @@ async def logout(request: Request):
 @app.get("/api/check-auth")
 async def check_auth(request: Request):
     token = request.cookies.get("session_token")
-    return {"authenticated": verify_session(token), "username": sessions[token]["username"] if verify_session(token) else None}
+    u = session_user(token)
+    return {"authenticated": u is not None, "username": u}
 
 @app.get("/api/security/public-key")
 async def get_public_key():
     if not HAS_CRYPTO: raise HTTPException(501, "Encryption not available")
     return rsa_public_jwk
 
-@app.get("/api/models", response_model=List[ModelStatus])
-async def list_models(db: SessionLocal = Depends(get_db), u=Depends(get_current_user)):
-    db_models = db.query(Model).all()
+MODEL_ROW_COLUMNS = (Model.id, Model.name, Model.hf_model_id, Model.model_type, Model.config, Model.download_status, Model.size_gb)
+_models_gen = 0  # bumped on every commit; model rows only change through commits
+_model_rows: Tuple[int, list] = (-1, [])
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_model_rows(_):
+    global _models_gen
+    _models_gen += 1
+
+def model_rows(db: SessionLocal) -> list:
+    """Model table rows, re-read only after some session has committed since the last read."""
+    global _model_rows
+    gen = _models_gen
+    if _model_rows[0] != gen:
+        # Tagged with the generation seen before the query, so a commit racing the read leaves the entry stale.
+        _model_rows = (gen, db.execute(select(*MODEL_ROW_COLUMNS)).all())
+    return _model_rows[1]
+
+def model_statuses(db: SessionLocal) -> List[ModelStatus]:
+    # Rows come straight from our own DB and state dicts, so skip validation and build models directly.
+    rm, ms, construct = running_models, model_states, ModelStatus.model_construct
     res = []
-    for m in db_models:
-        s = ModelStatus(id=m.id, name=m.name, hf_model_id=m.hf_model_id, model_type=m.model_type, config=m.config, download_status=m.download_status, size_gb=m.size_gb, is_running=False, status_text=m.download_status)
-        if m.id in running_models:
-            i = running_models[m.id]
-            s.is_running = True; s.status_text = "running"; s.port = i["port"]; s.pid = i["pid"]; s.gpu_ids = i["gpu_ids"]
-        elif m.id in model_states:
-            st = model_states[m.id]
-            s.status_text = st["status"]
-            if st["status"] == "error": s.error_message = st.get("message")
-        res.append(s)
+    for m in model_rows(db):
+        extra = {"is_running": False, "status_text": m.download_status}
+        if (i := rm.get(m.id)) is not None:
+            extra = {"is_running": True, "status_text": "running", "port": i["port"], "pid": i["pid"], "gpu_ids": i["gpu_ids"]}
+        elif (st := ms.get(m.id)) is not None:
+            extra["status_text"] = st["status"]
+            if st["status"] == "error": extra["error_message"] = st.get("message")
+        res.append(construct(id=m.id, name=m.name, hf_model_id=m.hf_model_id, model_type=m.model_type, config=m.config, download_status=m.download_status, size_gb=m.size_gb, **extra))
     return res
 
+@app.get("/api/models", response_model=List[ModelStatus])
+async def list_models(db: SessionLocal = Depends(get_db), u=Depends(get_current_user)):
+    return Response(MODEL_LIST_ADAPTER.dump_json(model_statuses(db)), media_type="application/json")
+
 @app.put("/api/models/{model_id}/config")
 async def update_model_config(model_id: int, config: ModelConfigUpdate, db: SessionLocal = Depends(get_db), u=Depends(get_current_user)):
     m = db.query(Model).filter(Model.id == model_id).first()
     if not m: raise HTTPException(404, "Model not found")
     if m.id in running_models: raise HTTPException(400, "Stop model first")
-    m.config = config.dict(); db.commit()
+    m.config = config.model_dump(); db.commit()
     return {"success": True}
 
+async def launch_model(m: Model):
+    """Spawns the vLLM server for m and hands it to health_check_task, which registers it once it serves."""
+    cfg = m.config; port = find_available_port(); used_ports.add(port); gpu_ids = cfg.get("gpu_ids", "0")
+    cmd = build_vllm_command(m.path, m.name, port, cfg)
+    env = os.environ.copy(); env["CUDA_VISIBLE_DEVICES"] = gpu_ids
+    bc = LogBroadcaster(); log_broadcasters[m.id] = bc
+    try: proc = await asyncio.create_subprocess_exec(*cmd, env=env, start_new_session=True, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT, limit=PROCESS_LINE_LIMIT)
+    except OSError as e:
+        used_ports.discard(port); log_broadcasters.pop(m.id, None)
+        model_states[m.id] = {"status": "error", "message": f"Failed to launch vLLM: {e}"}
+        raise HTTPException(500, str(e))
+    asyncio.create_task(pump_process_output(m.id, proc, bc))
+    # The handle lets stop_model cancel the start; health_check_task only registers a process that is still the one here.
+    model_states[m.id] = {"status": "starting", "process": proc}
+    asyncio.create_task(health_check_task(m.id, port, proc, m.name, gpu_ids, bc))
+
 @app.post("/api/models/{model_id}/start")
 async def start_model(model_id: int, db: SessionLocal = Depends(get_db), u=Depends(get_current_user)):
-    if model_id in running_models: raise HTTPException(400, "Already running")
+    if model_id in running_models or model_states.get(model_id, {}).get("status") == "starting": raise HTTPException(400, "Already running")
     m = db.query(Model).filter(Model.id == model_id).first()
     if not m or m.download_status != "completed": raise HTTPException(404, "Not ready")
-    cfg = m.config; port = find_available_port(); gpu_ids = cfg.get("gpu_ids", "0")
-    cmd = [sys.executable, "-m", "vllm.entrypoints.openai.api_server", "--model", str(m.path), "--served-model-name", m.name, "--port", str(port), "--host", "0.0.0.0", "--gpu-memory-utilization", str(cfg["gpu_memory_utilization"]), "--tensor-parallel-size", str(cfg["tensor_parallel_size"]), "--max-model-len", str(cfg["max_model_len"]), "--dtype", cfg["dtype"]]
-    if q := cfg.get("quantization"): cmd.extend(["--quantization", q])
-    if cfg.get("trust_remote_code"): cmd.append("--trust-remote-code")
-    if cfg.get("enable_prefix_caching"): cmd.append("--enable-prefix-caching")
-    env = os.environ.copy(); env["CUDA_VISIBLE_DEVICES"] = gpu_ids
-    bc = LogBroadcaster(); log_broadcasters[model_id] = bc
-    proc = subprocess.Popen(cmd, env=env, preexec_fn=os.setsid, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
-    def stream(p, b):
-        for l in iter(p.stdout.readline, ""): b.push(l)
-    Thread(target=stream, args=(proc, bc), daemon=True).start()
-    model_states[model_id] = {"status": "starting"}
-    asyncio.create_task(health_check_task(m.id, port, proc, m.name, gpu_ids, bc))
+    await launch_model(m)
     return {"success": True}
 
 @app.post("/api/models/{model_id}/stop")
 async def stop_model(model_id: int, u=Depends(get_current_user)):
-    if model_id in model_states: del model_states[model_id]
+    st = model_states.get(model_id)
+    if model_id not in running_models and st and st["status"] == "starting":
+        # Cancels the start: health_check_task sees its state gone and will not register the server.
+        del model_states[model_id]; log_broadcasters.pop(model_id, None)
+        try: await terminate_process_group(st["process"])
+        except Exception as e: print(f"Error stopping model {model_id}: {e}")
+        return {"success": True}
+    model_states.pop(model_id, None)
     if model_id not in running_models: raise HTTPException(404, "Not running")
-    try: os.killpg(os.getpgid(running_models[model_id]["pid"]), signal.SIGTERM)
-    except: pass
-    del running_models[model_id]
-    if model_id in log_broadcasters: del log_broadcasters[model_id]
+    # Detach everything before awaiting the exit, so a start issued meanwhile is not torn down with it.
+    info = unregister_running_model(model_id)
+    log_broadcasters.pop(model_id, None)
+    try: await terminate_process_group(info["process"])
+    except Exception as e: print(f"Error stopping model {model_id}: {e}")
     return {"success": True}
 
 @app.post("/api/models/{model_id}/clear_error")
@@ -574,38 +1199,47 @@ async def clear_error_state(model_id: int, u=Depends(get_current_user)):
     db.close()
     return {"success": True}
 
+def dashboard_stats(db: SessionLocal, snap: dict) -> DashboardStats:
+    return DashboardStats(total_models=len(model_rows(db)), running_models=len(running_models), system_cpu_percent=snap["cpu"], system_memory_percent=snap["mem"])
+
+def gpu_infos(snap: dict) -> List[GPUInfo]:
+    nv_procs = snap["procs"]
+    res = []
+    for g in snap["gpus"]:
+        plist = [GPUProcess(pid=p["pid"], process_name=p["process_name"], gpu_memory_usage=p["gpu_memory_usage"], managed_model_id=pid_to_model.get(p["pid"])) for p in nv_procs.get(g["id"], ())]
+        res.append(GPUInfo(**g, processes=plist))
+    return res
+
 @app.get("/api/dashboard/stats")
 async def get_stats(db: SessionLocal = Depends(get_db), u=Depends(get_current_user)):
-    return DashboardStats(total_models=db.query(Model).count(), running_models=len(running_models), system_cpu_percent=psutil.cpu_percent(0.1), system_memory_percent=psutil.virtual_memory().percent)
+    return dashboard_stats(db, await get_gpu_snapshot())
+
+@app.get("/api/dashboard/all", response_model=DashboardSnapshot)
+async def get_dashboard_all(u=Depends(get_current_user)):
+    # Same payload /ws/dashboard pushes: one GPU snapshot and one DB session for all four panels.
+    return Response(await build_dashboard_snapshot(), media_type="application/json")
 
 @app.get("/api/gpus", response_model=List[GPUInfo])
 async def get_gpu_info(u=Depends(get_current_user)):
-    nv_procs = get_gpu_processes_from_nvidia_smi()
-    res = []
-    try:
-        for g in GPUtil.getGPUs():
-            plist = []
-            if g.id in nv_procs:
-                for p in nv_procs[g.id]:
-                    mid = next((k for k, v in running_models.items() if v["pid"] == p["pid"]), None)
-                    plist.append(GPUProcess(pid=p["pid"], process_name=p["process_name"], gpu_memory_usage=p["gpu_memory_usage"], managed_model_id=mid))
-            res.append(GPUInfo(id=g.id, name=g.name, memory_total_mb=int(g.memoryTotal), memory_used_mb=int(g.memoryUsed), utilization_percent=float(g.load*100), temperature=g.temperature, processes=plist))
-    except: pass
-    return res
+    return Response(GPU_LIST_ADAPTER.dump_json(gpu_infos(await get_gpu_snapshot())), media_type="application/json")
 
 @app.post("/api/gpus/kill/{pid}")
 async def kill_gpu(pid: int, req: KillProcessRequest = None, u=Depends(get_current_user)):
     if not req: req = KillProcessRequest()
-    if mid := next((k for k, v in running_models.items() if v["pid"] == pid), None): return await stop_model(mid, u)
+    if (mid := pid_to_model.get(pid)) is not None: return await stop_model(mid, u)
     try:
         os.kill(pid, signal.SIGTERM)
+        invalidate_gpu_snapshot()
         return {"success": True, "message": f"Killed {pid}"}
     except PermissionError:
         if os.name == 'nt': raise HTTPException(403, "Permission denied (Windows)")
+        # Already root or CAP_KILL: sudo cannot help, so do not word this like the sudo prompt's trigger.
+        if CAN_KILL_ANY: raise HTTPException(403, "Process not killable")
         if not req.encrypted_sudo_password: raise HTTPException(403, "Sudo password required")
         try:
             sp = decrypt_password(req.encrypted_sudo_password)
-            subprocess.run(["sudo", "-S", "kill", "-9", str(pid)], input=f"{sp}\n", check=True, capture_output=True, text=True)
+            await asyncio.to_thread(sudo_kill, pid, sp)
+            invalidate_gpu_snapshot()
             return {"success": True, "message": f"Killed {pid} with sudo"}
         except Exception as e: raise HTTPException(500, f"Sudo failed: {str(e)}")
     except Exception as e: raise HTTPException(500, str(e))
@@ -613,27 +1247,44 @@ async def kill_gpu(pid: int, req: KillProcessRequest = None, u=Depends(get_curre
 @app.post("/api/models/scan")
 async def scan_models(db: SessionLocal = Depends(get_db), u=Depends(get_current_user)):
     if not MODEL_DIR.exists(): raise HTTPException(404, "No model dir")
-    existing = {m[0] for m in db.query(Model.name).all()}; count = 0
-    for e in os.scandir(MODEL_DIR):
-        if e.is_dir() and e.name not in existing:
-            p = Path(e.path)
-            if (p/"config.json").exists():
-                try:
-                    with open(p/"config.json") as f: mt = ModelType.EMBEDDING if "embedding" in json.load(f).get("model_type", "") else ModelType.TEXT
-                    s = sum(f.stat().st_size for f in p.glob("**/*") if f.is_file())
-                    db.add(Model(name=e.name, hf_model_id=f"local/{e.name}", path=str(p), model_type=mt, download_status="completed", size_gb=s/1024**3))
-                    count+=1
-                except: pass
-    if count: db.commit()
+    entries = [e for e in os.scandir(MODEL_DIR) if e.is_dir()]
+    # Only look up rows for directories actually on disk, in chunks that stay under SQLite's bound-parameter limit.
+    existing = {}
+    for i in range(0, len(entries), SQL_IN_CHUNK):
+        names = [e.name for e in entries[i:i + SQL_IN_CHUNK]]
+        existing.update((r.name, r) for r in db.execute(select(Model.id, Model.name, Model.download_status, Model.dir_mtime).where(Model.name.in_(names))))
+    rows, updates = [], []
+    for e in entries:
+        m = existing.get(e.name)
+        if m is not None:
+            # Only re-walk a known model when its top-level directory changed since the last sizing.
+            if m.download_status == "completed" and m.dir_mtime != (mtime := e.stat().st_mtime):
+                updates.append({"id": m.id, "size_gb": dir_size(e.path)/1024**3, "dir_mtime": mtime})
+            continue
+        p = Path(e.path)
+        if (p/"config.json").exists():
+            try:
+                with open(p/"config.json") as f: mt = ModelType.EMBEDDING if "embedding" in json.load(f).get("model_type", "") else ModelType.TEXT
+                rows.append({"name": e.name, "hf_model_id": f"local/{e.name}", "path": str(p), "model_type": mt, "download_status": "completed", "size_gb": dir_size(p)/1024**3, "dir_mtime": e.stat().st_mtime})
+            except: pass
+    if rows: db.bulk_insert_mappings(Model, rows)
+    if updates: db.bulk_update_mappings(Model, updates)
+    if rows or updates: db.commit()
+    count = len(rows)
     return {"success": True, "message": f"Imported {count} models"}
 
-@app.delete("/api/models/{model_id}")
+@app.delete("/api/models/{model_id}", status_code=202)
 async def delete_model(model_id: int, db: SessionLocal = Depends(get_db), u=Depends(get_current_user)):
     if model_id in running_models: raise HTTPException(400, "Running")
+    # A starting model has a live server that only its start/stop paths may tear down.
+    if model_states.get(model_id, {}).get("status") == "starting": raise HTTPException(409, "Model is starting; stop it first")
     m = db.query(Model).filter(Model.id == model_id).first()
     if not m: raise HTTPException(404, "Not found")
-    if m.path and Path(m.path).exists(): shutil.rmtree(m.path)
-    db.delete(m); db.commit()
+    if model_id in deleting_models: raise HTTPException(409, "Already being deleted")
+    # The row stays, marked "deleting" (not startable, skipped by scans), until the files are gone.
+    m.download_status = "deleting"; db.commit()
+    model_states.pop(model_id, None)
+    start_model_delete(m.id, m.path)
     return {"success": True}
 
 @app.post("/api/models/pull")
@@ -646,6 +1297,9 @@ async def pull_model(req: PullModelRequest, db: SessionLocal = Depends(get_db),
 
 @app.get("/api/system/info")
 async def sys_info(u=Depends(get_current_user)):
+    return system_info()
+
+def system_info() -> SystemInfo:
     d, v = get_system_info_sync()
     return SystemInfo(dev_mode=d, vllm_version=v)
 
@@ -662,15 +1316,20 @@ async def admin_settings(db: SessionLocal = Depends(get_db), u=Depends(get_curre
 @app.post("/api/admin/change-password")
 async def change_pw(req: ChangePasswordRequest, db: SessionLocal = Depends(get_db), u=Depends(get_current_user)):
     if IS_PASSWORD_ENV_MANAGED: raise HTTPException(400, "Env managed")
-    if hash_password(req.current_password) != get_admin_password_info(db)["hash"]: raise HTTPException(403, "Bad password")
+    if not await admin_password_matches(req.current_password, db): raise HTTPException(403, "Bad password")
     if not req.new_password: raise HTTPException(400, "Empty password")
+    new_hash = await asyncio.to_thread(hash_password, req.new_password)
     s = db.query(Setting).filter(Setting.key == "admin_password_hash").first()
-    if not s: s = Setting(key="admin_password_hash", value=hash_password(req.new_password)); db.add(s)
-    else: s.value = hash_password(req.new_password)
+    if not s: s = Setting(key="admin_password_hash", value=new_hash); db.add(s)
+    else: s.value = new_hash
     db.commit()
+    invalidate_admin_password_cache()
     return {"success": True}
 
 # --- Updated Hub Search Endpoint ---
+# filter_type -> term appended to the Hub search text
+HUB_FILTER_TERMS = {"awq": "awq", "gptq": "gptq", "gguf": "gguf", "compressed-tensors": "compressed-tensors", "fp8": "fp8"}
+
 @app.get("/api/hub/search")
 async def search_hub(
     query: Optional[str] = None, 
@@ -680,48 +1339,28 @@ async def search_hub(
     u=Depends(get_current_user)
 ):
     api = HfApi()
-    # Enable 'full' metadata to get siblings for size calculation
     search_params = {
         "filter": "text-generation",
         "sort": sort,
         "direction": -1,
         "limit": limit,
-        "full": True
     }
     
-    search_text = query or ""
-    if filter_type == "awq": search_text += " awq"
-    elif filter_type == "gptq": search_text += " gptq"
-    elif filter_type == "gguf": search_text += " gguf"
-    elif filter_type == "compressed-tensors": search_text += " compressed-tensors"
-    
-    if search_text.strip():
-        search_params["search"] = search_text.strip()
+    if search_text := " ".join(filter(None, ((query or "").strip(), HUB_FILTER_TERMS.get(filter_type)))):
+        search_params["search"] = search_text
+
+    def fetch():
+        # list_models pages lazily over HTTP, so the whole iteration belongs in the worker thread.
+        return [{
+            "id": m.modelId,
+            "likes": m.likes,
+            "downloads": m.downloads,
+            "tags": m.tags,
+            "pipeline_tag": m.pipeline_tag,
+        } for m in api.list_models(**search_params)]
 
     try:
-        models = api.list_models(**search_params)
-        results = []
-        for m in models:
-            # Calculate size in GB from siblings if available
-            size_gb = 0.0
-            if m.siblings:
-                total_bytes = sum(s.rfilename.endswith(('.bin', '.safetensors', '.pt')) and 0 or 0 for s in m.siblings)
-                # HfApi list_models siblings often don't contain size unless fetched specifically.
-                # Actually, 'full=True' gives siblings but maybe not sizes in all versions.
-                # Let's try to use 'safetensors' metadata if present or just skip if too slow.
-                # To keep it fast, we might not get exact size. 
-                # We'll assume 0 if not easily available to avoid slow individual calls.
-                pass
-
-            results.append({
-                "id": m.modelId,
-                "likes": m.likes,
-                "downloads": m.downloads,
-                "tags": m.tags,
-                "pipeline_tag": m.pipeline_tag,
-                # "size_gb": size_gb 
-            })
-        return results
+        return await asyncio.to_thread(fetch)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -729,9 +1368,7 @@ async def search_hub(
 async def ws_pull(ws: WebSocket, model_id: int):
     await ws.accept()
     if model_id not in download_tasks: return await ws.close()
-    q = download_tasks[model_id]["log_queue"]
-    try:
-        while (l := await asyncio.to_thread(q.get)) is not None: await ws.send_text(l)
+    try: await stream_log_queue(ws, download_tasks[model_id]["log_queue"])
     except: pass
     finally: 
         if model_id in download_tasks: del download_tasks[model_id]
@@ -749,14 +1386,124 @@ async def ws_logs(ws: WebSocket, model_id: int):
 async def ws_upgrade(ws: WebSocket):
     await ws.accept()
     if not upgrade_task: return await ws.close()
-    q = upgrade_task["log_queue"]
-    try:
-        while (l := await asyncio.to_thread(q.get)) is not None: await ws.send_text(l)
+    try: await stream_log_queue(ws, upgrade_task["log_queue"])
     except: pass
 
-app.mount("/static", StaticFiles(directory="frontend"), name="static")
+def read_dashboard_db(snap: dict):
+    db = SessionLocal()
+    try: return model_statuses(db), dashboard_stats(db, snap)
+    finally: db.close()
+
+async def build_dashboard_sections() -> Dict[str, str]:
+    """Each DashboardSnapshot field serialized on its own, once no matter how many clients receive it."""
+    snap = await get_gpu_snapshot()
+    models, stats = await asyncio.to_thread(read_dashboard_db, snap)
+    return {"stats": stats.model_dump_json(), "models": MODEL_LIST_ADAPTER.dump_json(models).decode(),
+            "gpus": GPU_LIST_ADAPTER.dump_json(gpu_infos(snap)).decode(), "system": system_info().model_dump_json()}
+
+def dashboard_frame(sections: Dict[str, str], keys) -> str:
+    return "{" + ",".join(f'"{k}":{sections[k]}' for k in keys) + "}"
+
+async def build_dashboard_snapshot() -> str:
+    sections = await build_dashboard_sections()
+    return dashboard_frame(sections, sections)
+
+async def dashboard_pusher():
+    """One sampler for all dashboard clients; each client only receives the sections that changed since its last frame."""
+    while True:
+        await asyncio.sleep(GPU_POLL_INTERVAL_SECONDS)
+        if not dashboard_clients: continue
+        try: sections = await build_dashboard_sections()
+        except Exception as e:
+            print(f"Dashboard snapshot failed: {e}"); continue
+        frames, jobs = {}, []
+        for ws, c in tuple(dashboard_clients.items()):
+            if not verify_session(c["token"]):
+                jobs.append((ws, True, ws.close(1008))); continue
+            changed = tuple(k for k, v in sections.items() if c["sent"].get(k) != v)
+            if not changed: continue
+            # Clients that are in the same state share one encoded frame.
+            if changed not in frames: frames[changed] = dashboard_frame(sections, changed)
+            c["sent"] = sections
+            jobs.append((ws, False, ws.send_text(frames[changed])))
+        results = await asyncio.gather(*(j for _, _, j in jobs), return_exceptions=True)
+        for (ws, drop, _), r in zip(jobs, results):
+            if drop or isinstance(r, Exception): dashboard_clients.pop(ws, None)
+
+@app.websocket("/ws/dashboard")
+async def ws_dashboard(ws: WebSocket):
+    await ws.accept()
+    token = ws.cookies.get("session_token")
+    if not verify_session(token): return await ws.close(1008)
+    try:
+        # The full snapshot goes out before the client is registered, so no delta can overtake it.
+        sections = await build_dashboard_sections()
+        await ws.send_text(dashboard_frame(sections, sections))
+        dashboard_clients[ws] = {"token": token, "sent": sections}
+        while True: await ws.receive_text()
+    except: pass
+    finally: dashboard_clients.pop(ws, None)
+
+FRONTEND_DIR = Path("frontend")
+
+def load_page(path: Path, media_type: str) -> dict:
+    """Reads a page once and keeps it alongside its compressed encodings, so serving it costs no file I/O or compression."""
+    raw = path.read_bytes()
+    tag = hashlib.sha256(raw).hexdigest()[:20]
+    encoded = [("gzip", gzip.compress(raw, 9))]
+    if HAS_BROTLI: encoded.insert(0, ("br", brotli.compress(raw, quality=11)))
+    # Each encoding is a distinct representation and gets its own strong validator; listed in order of preference.
+    return {"media_type": media_type, "raw": raw, "etag": f'"{tag}"', "encoded": [(enc, body, f'"{tag}-{enc}"') for enc, body in encoded]}
+
+INDEX_PAGE = load_page(FRONTEND_DIR / "index.html", "text/html")
+APP_CSS = load_page(FRONTEND_DIR / "app.css", "text/css")
+SCRIPT_JS = load_page(FRONTEND_DIR / "script.js", "text/javascript")
+# index.html references app.css and script.js with a ?v= version that is bumped on change, so both can be cached for good.
+IMMUTABLE_CACHE = "public, max-age=604800, immutable"
+
+def accepts_encoding(r: Request, encoding: str) -> bool:
+    """True if Accept-Encoding allows encoding with a nonzero q, by name or else through "*"."""
+    wildcard = False
+    for item in r.headers.get("accept-encoding", "").split(","):
+        name, *params = item.split(";")
+        q = 1.0
+        for p in params:
+            k, _, v = p.partition("=")
+            if k.strip().lower() == "q":
+                try: q = float(v)
+                except ValueError: q = 0.0
+        name = name.strip().lower()
+        if name == encoding: return q > 0
+        if name == "*": wildcard = q > 0
+    return wildcard
+
+def etag_matches(r: Request, etag: str) -> bool:
+    """If-None-Match check: "*" or any listed tag equal to etag under weak comparison."""
+    tags = [t.strip() for t in r.headers.get("if-none-match", "").split(",")]
+    return "*" in tags or any(t.removeprefix("W/") == etag for t in tags)
+
+def page_response(r: Request, page: dict, cache_control: str = "no-cache") -> Response:
+    """Serves a preloaded page, answering 304 when the client already holds the current version."""
+    body, etag, headers = page["raw"], page["etag"], {"Vary": "Accept-Encoding", "Cache-Control": cache_control}
+    for enc, encoded, enc_etag in page["encoded"]:
+        if accepts_encoding(r, enc):
+            body, etag, headers["Content-Encoding"] = encoded, enc_etag, enc
+            break
+    headers["ETag"] = etag
+    if etag_matches(r, etag):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=page["media_type"], headers=headers)
+
+@app.get("/static/app.css")
+async def app_css(r: Request): return page_response(r, APP_CSS, IMMUTABLE_CACHE)
+
+@app.get("/static/script.js")
+async def script_js(r: Request): return page_response(r, SCRIPT_JS, IMMUTABLE_CACHE)
+
+app.mount("/static", StaticFiles(directory=FRONTEND_DIR), name="static")
 @app.get("/")
-async def index(r: Request): return FileResponse("frontend/index.html")
+async def index(r: Request): return page_response(r, INDEX_PAGE)
 
 if __name__ == "__main__":
     import uvicorn